@@ -9,14 +9,48 @@ Usage:
   python3 sync-mission-data.py --watch   # auto-sync on file changes
 """
 
+import heapq
 import json
 import os
 import sys
 import time
-from collections import deque
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # optional — token sums fall back to builtin sum()
+    np = None
+
+try:
+    import orjson
+except ImportError:  # optional — output falls back to stdlib json
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # optional — per-provider sums fall back to a dict loop
+    njit = None
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _agg_by_key(key_id, inp, out, tot, nkeys):
+        """Bucket token sums by (provider, model) id in compiled code."""
+        in_sum = np.zeros(nkeys, np.int64)
+        out_sum = np.zeros(nkeys, np.int64)
+        tot_sum = np.zeros(nkeys, np.int64)
+        counts = np.zeros(nkeys, np.int64)
+        for i in range(key_id.shape[0]):
+            k = key_id[i]
+            in_sum[k] += inp[i]
+            out_sum[k] += out[i]
+            tot_sum[k] += tot[i]
+            counts[k] += 1
+        return in_sum, out_sum, tot_sum, counts
+else:
+    _agg_by_key = None
+
 # Paths — adjust these for your deployment
 TASKS_FILE = Path.home() / ".superclaw/workspace/memory/squad/TASKS.json"
 OUTPUT_FILE = Path(__file__).parent / "mission-control-data.json"
@@ -55,41 +89,74 @@ STATE_MAP = {
 
 
 def load_tasks():
-    if not TASKS_FILE.exists():
+    try:
+        with open(TASKS_FILE) as f:
+            return json.load(f)
+    except OSError:
         return {"tasks": [], "agents": [], "activity_log": []}
-    with open(TASKS_FILE) as f:
-        return json.load(f)
 
 
-def _tail_lines(path, limit=200):
-    if not path.exists():
+# Incremental tail state for the warning/thread streams: path → (inode, offset).
+# Each sync reads only the bytes appended since the last one; an inode change
+# (log rotation) or a shrunken file re-tails the last _TAIL_WINDOW bytes.
+_TAIL_WINDOW = 64 * 1024
+_TAIL_STATE = {}
+_WARNING_CACHE = []
+_WARNING_SEEN = set()
+_WARNING_CACHE_MAX = 200
+
+
+def _read_new_lines(path):
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            inode, offset = _TAIL_STATE.get(path, (None, 0))
+            if inode != st.st_ino or offset > st.st_size:
+                offset = max(0, st.st_size - _TAIL_WINDOW)
+            f.seek(offset)
+            data = f.read()
+            # Only consume up to the last complete line — a record being
+            # appended concurrently with this read may be half-written, and
+            # advancing past it would split it across two reads (both halves
+            # failing to parse). The partial tail is re-read next sync.
+            end = data.rfind(b"\n") + 1
+            data = data[:end]
+            _TAIL_STATE[path] = (st.st_ino, offset + end)
+    except OSError:
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        return list(deque(f, maxlen=limit))
+    return data.decode("utf-8", errors="replace").splitlines()
+
+
+def _hhmm_date(ts):
+    """Split an ISO timestamp into (HH:MM, date) with one partition scan."""
+    head, sep, tail = ts.partition("T")
+    if not sep:
+        return "", ""
+    return tail[:5], head
 
 
 def _iso_to_hhmm(ts):
-    if "T" in ts:
-        return ts.split("T", 1)[1][:5]
-    return ""
+    return _hhmm_date(ts)[0]
 
 
-def _extract_severity(text):
-    t = text.lower()
-    if "critical" in t:
+def _extract_severity(text_lower):
+    """Classify severity. Expects already-lowercased text."""
+    if "critical" in text_lower:
         return "critical"
-    if "high" in t:
+    if "high" in text_lower:
         return "high"
-    if "low" in t:
+    if "low" in text_lower:
         return "low"
     return "medium"
 
 
-def _parse_warning_text(text):
+def _parse_warning_text(text, text_lower=None):
     msg = text.strip()
-    if msg.lower().startswith("warning:"):
+    msg_l = text_lower if text_lower is not None else msg.lower()
+    if msg_l.startswith("warning:"):
         msg = msg.split(":", 1)[1].strip()
-    severity = _extract_severity(msg)
+        msg_l = msg.lower()
+    severity = _extract_severity(msg_l)
     scope = "general"
 
     # Optional compact format:
@@ -113,8 +180,6 @@ def _parse_warning_text(text):
 
 
 def load_context_packet():
-    if not CCRP_PACKET_FILE.exists():
-        return None
     try:
         with open(CCRP_PACKET_FILE, "r", encoding="utf-8") as f:
             raw = json.load(f)
@@ -143,133 +208,121 @@ def load_context_packet():
 
 
 def load_warnings(limit=20):
-    warnings = []
-    seen = set()
-
-    if WARNING_STREAM_FILE.exists():
-        for line in _tail_lines(WARNING_STREAM_FILE, limit=200):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            msg = str(rec.get("message", "")).strip()
-            if not msg:
-                continue
-            severity = str(rec.get("severity", _extract_severity(msg))).lower()
-            scope = str(rec.get("scope", "general"))
-            ts = str(rec.get("timestamp", ""))
-            src = str(rec.get("source", "anchor"))
-            key = (ts, severity, msg)
-            if key in seen:
-                continue
-            seen.add(key)
-            warnings.append({
-                "timestamp": ts,
-                "time": _iso_to_hhmm(ts),
-                "severity": severity,
-                "scope": scope,
-                "source": src,
-                "message": msg,
-            })
+    for line in _read_new_lines(WARNING_STREAM_FILE):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        msg = (rec.get("message") or "").strip()
+        if not msg:
+            continue
+        severity = rec.get("severity")
+        severity = severity.lower() if severity else _extract_severity(msg.lower())
+        scope = rec.get("scope") or "general"
+        ts = rec.get("timestamp") or ""
+        src = rec.get("source") or "anchor"
+        key = (ts, severity, msg)
+        if key in _WARNING_SEEN:
+            continue
+        _WARNING_SEEN.add(key)
+        _WARNING_CACHE.append({
+            "timestamp": ts,
+            "time": _iso_to_hhmm(ts),
+            "severity": severity,
+            "scope": scope,
+            "source": src,
+            "message": msg,
+        })
 
-    if THREAD_FILE.exists():
-        for line in _tail_lines(THREAD_FILE, limit=400):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            sender = str(rec.get("from", "")).lower()
-            msg_type = str(rec.get("type", "")).lower()
-            content = str(rec.get("content", "")).strip()
-            if not content:
-                continue
-            content_l = content.lower()
-
-            is_anchor_warning = (
-                sender == "anchor"
-                and (
-                    msg_type == "anchor"
-                    or "warning" in content_l
-                    or content_l.startswith("warn|")
-                    or content_l.startswith("warning|")
-                )
+    for line in _read_new_lines(THREAD_FILE):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        sender = (rec.get("from") or "").lower()
+        msg_type = (rec.get("type") or "").lower()
+        content = (rec.get("content") or "").strip()
+        if not content:
+            continue
+        content_l = content.lower()
+
+        is_anchor_warning = (
+            sender == "anchor"
+            and (
+                msg_type == "anchor"
+                or "warning" in content_l
+                or content_l.startswith("warn|")
+                or content_l.startswith("warning|")
             )
-            if not is_anchor_warning:
-                continue
-
-            parsed = _parse_warning_text(content)
-            ts = str(rec.get("timestamp", ""))
-            key = (ts, parsed["severity"], parsed["message"])
-            if key in seen:
-                continue
-            seen.add(key)
-            warnings.append({
-                "timestamp": ts,
-                "time": _iso_to_hhmm(ts),
-                "severity": parsed["severity"],
-                "scope": parsed["scope"],
-                "source": "anchor",
-                "message": parsed["message"],
-            })
+        )
+        if not is_anchor_warning:
+            continue
 
-    warnings.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-    return warnings[:limit]
+        parsed = _parse_warning_text(content, content_l)
+        ts = rec.get("timestamp") or ""
+        key = (ts, parsed["severity"], parsed["message"])
+        if key in _WARNING_SEEN:
+            continue
+        _WARNING_SEEN.add(key)
+        _WARNING_CACHE.append({
+            "timestamp": ts,
+            "time": _iso_to_hhmm(ts),
+            "severity": parsed["severity"],
+            "scope": parsed["scope"],
+            "source": "anchor",
+            "message": parsed["message"],
+        })
 
-
-def build_context():
-    packet = load_context_packet()
-    warnings = load_warnings(limit=20)
-    return {
-        "packet": packet,
-        "warnings": warnings,
-    }
+    _WARNING_CACHE.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+    if len(_WARNING_CACHE) > _WARNING_CACHE_MAX:
+        del _WARNING_CACHE[_WARNING_CACHE_MAX:]
+        _WARNING_SEEN.clear()
+        _WARNING_SEEN.update(
+            (w["timestamp"], w["severity"], w["message"]) for w in _WARNING_CACHE
+        )
+    return _WARNING_CACHE[:limit]
 
 
-def build_agents(data):
-    agents = []
-    for agent in data.get("agents", []):
-        aid = agent.get("id", "")
-        status = agent.get("status", "idle")
-        name = agent.get("name", AGENT_NAMES.get(aid, aid))
-        role = agent.get("role", AGENT_ROLES.get(aid, ""))
+# Last-built output sections, so watch mode only re-runs the builders whose
+# input files actually changed. Keys: agents/tasks/activity (from TASKS.json),
+# budget (session files), packet (CCRP), warnings (warning + thread streams).
+_SECTION_CACHE = {}
 
-        current_task = None
-        for task in data.get("tasks", []):
-            if aid in task.get("assigneeIds", []) and task.get("status") in ("in_progress", "assigned"):
-                current_task = task.get("title", "")
-                if status == "idle":
-                    status = "active"
-                break
 
-        agents.append({
-            "name": name, "key": aid, "role": role,
-            "status": status, "task": current_task, "lastCheckin": "\u2014",
-        })
-    return agents
+def build_all(data):
+    """Build agent rows, task columns, and the activity feed in one pass.
 
+    Tasks, agents, and activities each get iterated exactly once; the old
+    per-agent rescan of the task list is replaced by an `active_by_agent`
+    map filled during the task pass.
+    """
+    agent_name_by_id = {
+        a.get("id", ""): a.get("name", a.get("id", ""))
+        for a in data.get("agents", [])
+    }
 
-def build_tasks(data):
+    # Pass 1: tasks \u2192 kanban columns + first active task per agent
     columns = {"inbox": [], "assigned": [], "inProgress": [], "review": [], "done": []}
+    active_by_agent = {}
 
     for task in data.get("tasks", []):
         state = task.get("status", "inbox")
         column = STATE_MAP.get(state, "inbox")
 
+        if state in ("in_progress", "assigned"):
+            for aid in task.get("assigneeIds", []):
+                active_by_agent.setdefault(aid, task.get("title", ""))
+
         assignee_ids = task.get("assigneeIds", [])
         agent_name = "\u2014"
         if assignee_ids:
-            for a in data.get("agents", []):
-                if a.get("id") == assignee_ids[0]:
-                    agent_name = a.get("name", assignee_ids[0])
-                    break
-            else:
-                agent_name = assignee_ids[0]
+            agent_name = agent_name_by_id.get(assignee_ids[0], assignee_ids[0])
 
         ts = task.get("completedAt") or ""
         if not ts and task.get("comments"):
@@ -277,16 +330,16 @@ def build_tasks(data):
         if not ts:
             ts = task.get("createdAt", "")
 
-        time_str = ts.split("T")[1][:5] if "T" in ts else ""
+        time_str = _iso_to_hhmm(ts)
 
         comments = []
         for cmt in task.get("comments", []):
-            cmt_ts = cmt.get("timestamp", "")
+            cmt_time, cmt_date = _hhmm_date(cmt.get("timestamp", ""))
             comments.append({
                 "agent": cmt.get("fromAgentId", "system"),
                 "text": cmt.get("content", ""),
-                "time": cmt_ts.split("T")[1][:5] if "T" in cmt_ts else "",
-                "date": cmt_ts.split("T")[0] if "T" in cmt_ts else "",
+                "time": cmt_time,
+                "date": cmt_date,
             })
 
         columns[column].append({
@@ -301,24 +354,36 @@ def build_tasks(data):
             "commentCount": len(comments),
         })
 
-    return columns
+    # Pass 2: agents \u2192 status rows, using the map built above
+    agents = []
+    for agent in data.get("agents", []):
+        aid = agent.get("id", "")
+        status = agent.get("status", "idle")
+        current_task = active_by_agent.get(aid)
+        if current_task is not None and status == "idle":
+            status = "active"
 
+        agents.append({
+            "name": agent.get("name", AGENT_NAMES.get(aid, aid)),
+            "key": aid,
+            "role": agent.get("role", AGENT_ROLES.get(aid, "")),
+            "status": status, "task": current_task, "lastCheckin": "\u2014",
+        })
 
-def build_activity(data):
-    activity = []
-    for entry in data.get("activities", []):
-        ts = entry.get("timestamp", "")
-        activity.append({
+    # Pass 3: activities \u2192 20 most recent
+    recent = heapq.nlargest(
+        20, data.get("activities", []), key=lambda e: e.get("timestamp", "")
+    )
+    activity = [
+        {
             "agent": entry.get("agentId", "system"),
             "text": entry.get("message", ""),
-            "time": ts.split("T")[1][:5] if "T" in ts else "",
-            "sort_ts": ts,
-        })
+            "time": _iso_to_hhmm(entry.get("timestamp", "")),
+        }
+        for entry in recent
+    ]
 
-    activity.sort(key=lambda x: x.get("sort_ts", ""), reverse=True)
-    for a in activity:
-        a.pop("sort_ts", None)
-    return activity[:20]
+    return agents, columns, activity
 
 
 def build_token_usage():
@@ -327,43 +392,63 @@ def build_token_usage():
 
     for aid in AGENT_IDS:
         sf = AGENTS_DIR / aid / "sessions" / "sessions.json"
-        if not sf.exists():
-            continue
         try:
             with open(sf) as f:
                 sessions = json.load(f)
         except (json.JSONDecodeError, OSError):
             continue
 
-        a_in = a_out = a_total = a_count = 0
-        provider_seen = {}
-
-        for sess in sessions.values():
-            inp = sess.get("inputTokens", 0)
-            out = sess.get("outputTokens", 0)
-            tot = sess.get("totalTokens", 0)
-            provider = sess.get("modelProvider", "unknown")
-            model = sess.get("model", "unknown")
-
-            a_in += inp
-            a_out += out
-            a_total += tot
-            a_count += 1
-            provider_seen[provider] = provider_seen.get(provider, 0) + 1
-
-            key = (provider, model)
-            if key not in provider_agg:
-                provider_agg[key] = {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0, "sessionCount": 0}
-            provider_agg[key]["inputTokens"] += inp
-            provider_agg[key]["outputTokens"] += out
-            provider_agg[key]["totalTokens"] += tot
-            provider_agg[key]["sessionCount"] += 1
-
-        primary = max(provider_seen, key=provider_seen.get) if provider_seen else "unknown"
+        sess = list(sessions.values())
+        if not sess:
+            continue
+
+        # Structure-of-arrays: pull each token column out once, then sum the
+        # whole column in C instead of bumping counters per session in Python.
+        if np is not None:
+            inp = np.fromiter((s.get("inputTokens", 0) for s in sess), dtype=np.int64, count=len(sess))
+            out = np.fromiter((s.get("outputTokens", 0) for s in sess), dtype=np.int64, count=len(sess))
+            tot = np.fromiter((s.get("totalTokens", 0) for s in sess), dtype=np.int64, count=len(sess))
+            a_in, a_out, a_total = int(inp.sum()), int(out.sum()), int(tot.sum())
+        else:
+            inp = [s.get("inputTokens", 0) for s in sess]
+            out = [s.get("outputTokens", 0) for s in sess]
+            tot = [s.get("totalTokens", 0) for s in sess]
+            a_in, a_out, a_total = sum(inp), sum(out), sum(tot)
+
+        keys = [(s.get("modelProvider", "unknown"), s.get("model", "unknown")) for s in sess]
+        provider_seen = Counter(k[0] for k in keys)
+
+        if _agg_by_key is not None:
+            # Map keys to dense int ids in Python, reduce in compiled code
+            key_ids = {}
+            key_id = np.fromiter(
+                (key_ids.setdefault(k, len(key_ids)) for k in keys),
+                dtype=np.int64, count=len(keys),
+            )
+            in_sum, out_sum, tot_sum, counts = _agg_by_key(key_id, inp, out, tot, len(key_ids))
+            for key, idx in key_ids.items():
+                agg = provider_agg.get(key)
+                if agg is None:
+                    agg = provider_agg[key] = {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0, "sessionCount": 0}
+                agg["inputTokens"] += int(in_sum[idx])
+                agg["outputTokens"] += int(out_sum[idx])
+                agg["totalTokens"] += int(tot_sum[idx])
+                agg["sessionCount"] += int(counts[idx])
+        else:
+            for key, s_in, s_out, s_tot in zip(keys, inp, out, tot):
+                agg = provider_agg.get(key)
+                if agg is None:
+                    agg = provider_agg[key] = {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0, "sessionCount": 0}
+                agg["inputTokens"] += int(s_in)
+                agg["outputTokens"] += int(s_out)
+                agg["totalTokens"] += int(s_tot)
+                agg["sessionCount"] += 1
+
+        primary = provider_seen.most_common(1)[0][0] if provider_seen else "unknown"
         agent_agg[aid] = {
             "agentId": aid, "name": AGENT_NAMES.get(aid, aid),
             "inputTokens": a_in, "outputTokens": a_out,
-            "totalTokens": a_total, "sessionCount": a_count,
+            "totalTokens": a_total, "sessionCount": len(sess),
             "primaryProvider": primary,
         }
 
@@ -386,58 +471,185 @@ def build_token_usage():
     }
 
 
-def sync():
-    data = load_tasks()
+def sync(changed=None):
+    """Regenerate the dashboard JSON.
+
+    `changed` is an optional set of input keys ("tasks", "agents", "ccrp",
+    "warnings", "thread"); sections whose inputs are unchanged are reused
+    from the previous sync. None (or an empty cache) rebuilds everything.
+    """
     now = datetime.now(timezone.utc).astimezone()
     timestamp = now.strftime("%Y-%m-%d %H:%M %Z")
 
+    cache = _SECTION_CACHE
+    rebuild_all = changed is None or not cache
+
+    if rebuild_all or "tasks" in changed:
+        data = load_tasks()
+        cache["agents"], cache["tasks"], cache["activity"] = build_all(data)
+        cache["task_count"] = len(data.get("tasks", []))
+    if rebuild_all or "agents" in changed:
+        cache["budget"] = build_token_usage()
+    if rebuild_all or "ccrp" in changed:
+        cache["packet"] = load_context_packet()
+    if rebuild_all or "warnings" in changed or "thread" in changed:
+        cache["warnings"] = load_warnings(limit=20)
+
     output = {
         "lastUpdated": timestamp,
-        "agents": build_agents(data),
-        "tasks": build_tasks(data),
-        "activity": build_activity(data),
-        "budget": build_token_usage(),
-        "context": build_context(),
+        "agents": cache["agents"],
+        "tasks": cache["tasks"],
+        "activity": cache["activity"],
+        "budget": cache["budget"],
+        "context": {
+            "packet": cache["packet"],
+            "warnings": cache["warnings"],
+        },
     }
 
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(output, indent=2).encode("utf-8")
+
+    # Serialize in memory, write once, then publish atomically so dashboard
+    # readers never see a half-written file.
+    tmp = OUTPUT_FILE.with_suffix(".json.tmp")
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(payload)
+    os.replace(tmp, OUTPUT_FILE)
 
-    print(f"Synced {len(data.get('tasks',[]))} tasks -> {OUTPUT_FILE.name} [{timestamp}]")
+    print(f"Synced {cache['task_count']} tasks -> {OUTPUT_FILE.name} [{timestamp}]")
 
 
-def _get_watched_mtimes():
-    mtimes = []
-    if TASKS_FILE.exists():
-        mtimes.append(TASKS_FILE.stat().st_mtime)
-    if CCRP_PACKET_FILE.exists():
-        mtimes.append(CCRP_PACKET_FILE.stat().st_mtime)
-    if WARNING_STREAM_FILE.exists():
-        mtimes.append(WARNING_STREAM_FILE.stat().st_mtime)
-    if THREAD_FILE.exists():
-        mtimes.append(THREAD_FILE.stat().st_mtime)
-    for aid in AGENT_IDS:
-        sf = AGENTS_DIR / aid / "sessions" / "sessions.json"
-        if sf.exists():
-            mtimes.append(sf.stat().st_mtime)
-    return max(mtimes) if mtimes else 0
+def _mtime_or_zero(path):
+    """One stat per path — exists() would cost a second syscall."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
 
 
-def watch(interval=10):
-    print(f"[*] Watching TASKS.json + session files (Ctrl+C to stop)")
-    last_mtime = 0
+def _get_watched_mtimes():
+    """Per-input mtimes, keyed the same way sync(changed=...) expects."""
+    mtimes = {
+        "tasks": _mtime_or_zero(TASKS_FILE),
+        "ccrp": _mtime_or_zero(CCRP_PACKET_FILE),
+        "warnings": _mtime_or_zero(WARNING_STREAM_FILE),
+        "thread": _mtime_or_zero(THREAD_FILE),
+    }
+    agent_ids = set(AGENT_IDS)
+    agents_mtime = 0
+    try:
+        with os.scandir(AGENTS_DIR) as entries:
+            for entry in entries:
+                if entry.name in agent_ids:
+                    sf = os.path.join(entry.path, "sessions", "sessions.json")
+                    agents_mtime = max(agents_mtime, _mtime_or_zero(sf))
+    except OSError:
+        pass
+    mtimes["agents"] = agents_mtime
+    return mtimes
+
+
+def _watch_poll(interval=10):
+    last = {}
     while True:
         try:
-            mtime = _get_watched_mtimes()
-            if mtime != last_mtime:
-                sync()
-                last_mtime = mtime
+            mtimes = _get_watched_mtimes()
+            changed = {k for k, v in mtimes.items() if v != last.get(k)}
+            if changed:
+                sync(changed)
+                last = mtimes
             time.sleep(interval)
         except KeyboardInterrupt:
             print("\n[*] Stopped")
             break
 
 
+def watch(interval=10):
+    print(f"[*] Watching TASKS.json + session files (Ctrl+C to stop)")
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        print(f"[*] watchdog not installed — polling every {interval}s (pip install watchdog)")
+        _watch_poll(interval)
+        return
+
+    import threading
+
+    watched = {
+        str(TASKS_FILE): "tasks",
+        str(CCRP_PACKET_FILE): "ccrp",
+        str(WARNING_STREAM_FILE): "warnings",
+        str(THREAD_FILE): "thread",
+    }
+    agents_root = str(AGENTS_DIR)
+    lock = threading.Lock()
+    timer = None
+    pending = set()
+
+    def run_pending():
+        with lock:
+            changed = set(pending)
+            pending.clear()
+        sync(changed or None)
+
+    def schedule_sync():
+        # Debounce ~250ms so a burst of writes triggers one sync
+        nonlocal timer
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(0.25, run_pending)
+        timer.daemon = True
+        timer.start()
+
+    class Handler(FileSystemEventHandler):
+        def on_modified(self, event):
+            self._maybe(event)
+
+        def on_created(self, event):
+            self._maybe(event)
+
+        def on_moved(self, event):
+            # Atomic writes (tmp file + os.replace, as the sibling tools do
+            # for sessions.json and friends) surface as moved events whose
+            # dest_path is the watched file — key on that, not src_path
+            self._maybe(event, path=event.dest_path)
+
+        def _maybe(self, event, path=None):
+            if event.is_directory:
+                return
+            if path is None:
+                path = event.src_path
+            key = watched.get(path)
+            if key is None and path.startswith(agents_root) and path.endswith("sessions.json"):
+                key = "agents"
+            if key is not None:
+                with lock:
+                    pending.add(key)
+                schedule_sync()
+
+    observer = Observer()
+    handler = Handler()
+    for d in {TASKS_FILE.parent, COLLAB_DIR / "context", COLLAB_DIR}:
+        if d.exists():
+            observer.schedule(handler, str(d), recursive=False)
+    if AGENTS_DIR.exists():
+        observer.schedule(handler, str(AGENTS_DIR), recursive=True)
+    observer.start()
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("\n[*] Stopped")
+    finally:
+        observer.stop()
+        observer.join()
+
+
 if __name__ == "__main__":
     if "--watch" in sys.argv:
         sync()
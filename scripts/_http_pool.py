@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Shared keep-alive HTTP pool — SuperClaw webhook utilities
+
+Used by send_alert.py and send_email.py so repeated webhook POSTs from
+one process reuse a single TCP connection per host instead of paying a
+fresh handshake per call.
+"""
+
+import http.client
+import json
+import socket
+import time
+from urllib.parse import urlsplit, SplitResult
+
+try:
+    import orjson
+except ImportError:  # optional — serialization falls back to stdlib json
+    orjson = None
+
+TIMEOUT_SECONDS = 15
+DNS_TTL_SECONDS = 900
+
+# hostname -> (ip, expires_at monotonic); avoids a resolver round trip per POST
+_dns_cache: dict[str, tuple[str, float]] = {}
+
+# hostnames that failed to resolve (e.g. the n8n Docker alias on a bare-metal
+# deploy) — fail fast for the rest of the process instead of re-timing-out
+_broken_hosts: set[str] = set()
+
+# (scheme, host, port) -> open HTTP(S)Connection, created lazily on first POST
+_connections: dict[tuple[str, str, int], http.client.HTTPConnection] = {}
+
+# url -> urlsplit result, so hot callers parse each webhook URL once
+_parsed: dict[str, SplitResult] = {}
+
+
+def _resolve(host: str) -> str:
+    now = time.monotonic()
+    hit = _dns_cache.get(host)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    ip = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0][4][0]
+    _dns_cache[host] = (ip, now + DNS_TTL_SECONDS)
+    return ip
+
+
+def _split(url: str) -> SplitResult:
+    parts = _parsed.get(url)
+    if parts is None:
+        parts = _parsed[url] = urlsplit(url)
+    return parts
+
+
+# Gateway statuses that usually mean "n8n is reloading" — worth a brief
+# retry on the same host before failing over to the Docker fallback
+_RETRY_STATUSES = frozenset((502, 503, 504))
+
+
+def post_json(url: str, payload: dict | bytes, timeout: int = TIMEOUT_SECONDS) -> tuple[int, str]:
+    """POST JSON over a pooled keep-alive connection. Returns (status_code, response_body).
+
+    `payload` may be a dict or pre-serialized JSON bytes — callers that
+    assemble payloads from cached fragments can skip the dumps here.
+
+    Raises ConnectionError when the host is unreachable. A stale keep-alive
+    connection (server closed it between calls) is dropped and retried once
+    on a fresh socket before giving up. Transient 502/503/504 responses are
+    retried on the same URL with a short backoff (100 ms, then 400 ms)
+    before the status is surfaced to the caller's host-failover loop.
+    """
+    for attempt in (0, 1, 2):
+        status, body = _post_once(url, payload, timeout)
+        if status in _RETRY_STATUSES and attempt < 2:
+            time.sleep(0.1 * 4 ** attempt)
+            continue
+        return status, body
+
+
+def _post_once(url: str, payload: dict | bytes, timeout: int) -> tuple[int, str]:
+    parts = _split(url)
+    host = parts.hostname or "localhost"
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    if host in _broken_hosts:
+        raise ConnectionError(f"Cannot reach {url}: host '{host}' does not resolve")
+
+    if isinstance(payload, (bytes, bytearray)):
+        body = payload
+    elif orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        # Compact separators: one allocation fewer and no whitespace on the wire
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        "Connection": "keep-alive",
+        "Host": f"{host}:{port}",
+    }
+
+    key = (parts.scheme, host, port)
+    for attempt in (0, 1):
+        conn = _connections.get(key)
+        if conn is None:
+            if parts.scheme == "https":
+                # Connect by hostname: TLS needs SNI and certificate
+                # hostname verification, so the DNS shortcut doesn't apply
+                conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+            else:
+                try:
+                    ip = _resolve(host)
+                except socket.gaierror as e:
+                    _broken_hosts.add(host)
+                    raise ConnectionError(f"Cannot reach {url}: {e}") from e
+                conn = http.client.HTTPConnection(ip, port, timeout=timeout)
+            _connections[key] = conn
+        try:
+            conn.request("POST", path, body, headers)
+            resp = conn.getresponse()
+            resp_body = resp.read().decode("utf-8", errors="replace")
+            return resp.status, resp_body
+        except (http.client.BadStatusLine, http.client.RemoteDisconnected,
+                BrokenPipeError, ConnectionResetError) as e:
+            conn.close()
+            _connections.pop(key, None)
+            if attempt:
+                raise ConnectionError(f"Cannot reach {url}: {e}") from e
+            # fall through: retry once on a fresh connection
+        except OSError as e:
+            conn.close()
+            _connections.pop(key, None)
+            raise ConnectionError(f"Cannot reach {url}: {e}") from e
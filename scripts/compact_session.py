@@ -23,17 +23,33 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
+import mmap
 import os
 import shutil
+import sqlite3
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional — JSONL parsing falls back to stdlib json
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional — embedding falls back to the default event loop
+    uvloop = None
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 AGENTS_DIR = Path.home() / ".openclaw/agents"
 LANCEDB_PATH = Path.home() / ".openclaw/memory/lancedb"
@@ -41,15 +57,23 @@ OLLAMA_URL = "http://localhost:11434"
 EMBED_MODEL = "nomic-embed-text"  # 768d
 HERMES_URL = "http://localhost:8787"
 
+# One keep-alive connection pool for all Hermes/Ollama calls in this process
+CLIENT = httpx.Client(
+    timeout=120, limits=httpx.Limits(max_keepalive_connections=32)
+)
+
 # Compaction settings
 DEFAULT_THRESHOLD = 150000   # tokens — trigger compaction above this
 CHUNK_SIZE = 3500            # chars per chunk (nomic context safe)
 CHUNK_OVERLAP = 200          # chars overlap between chunks
 EMBED_BATCH = 64             # embeddings per Ollama call
+EMBED_CONCURRENCY = 8        # embed batches in flight at once
+COMPACT_WORKERS = 2          # agents compacted in parallel under --all
 SESSION_IMPORTANCE = 0.25    # low — agent self-summaries will be higher
 SESSION_CATEGORY = "session_history"
 SUMMARY_IMPORTANCE = 0.70    # agent's own summary of active threads
 ARCHIVE_DIR = Path.home() / ".openclaw/session_archive"
+EMBED_CACHE_PATH = Path.home() / ".openclaw/memory/embed_cache.sqlite"
 
 # Override this list with your actual agent IDs
 ALL_AGENTS = ["coordinator", "developer", "researcher", "monitor", "analyst"]
@@ -78,6 +102,53 @@ Grab your bearings:
 You're good. If someone messages you next, just roll with it — you have the context, it's in memory. No need to announce the rotation or explain yourself unless they ask."""
 
 
+# ─── JSON helpers ─────────────────────────────────────────────────────────────
+
+def _read_json(path: Path):
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(path: Path, data) -> None:
+    """Atomically write JSON; no-op when the serialized bytes are unchanged.
+
+    The runtime reads sessions.json concurrently, so the new content lands
+    in a sibling .tmp file and is swapped in with os.replace.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    try:
+        if path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def _post_json(url: str, payload: dict, timeout: int):
+    """POST a JSON payload, serialized with orjson when available."""
+    if orjson is not None:
+        return CLIENT.post(
+            url, content=orjson.dumps(payload),
+            headers={"content-type": "application/json"}, timeout=timeout,
+        )
+    return CLIENT.post(url, json=payload, timeout=timeout)
+
+
+def _emit_event(payload: dict) -> None:
+    """POST an event to Hermes on a daemon thread so the pipeline never waits."""
+    def _send():
+        try:
+            _post_json(f"{HERMES_URL}/api/v1/events", payload, timeout=5)
+        except Exception:
+            pass  # non-critical
+    threading.Thread(target=_send, daemon=True).start()
+
+
 # ─── Session reading ──────────────────────────────────────────────────────────
 
 def get_session_info(agent: str) -> dict | None:
@@ -86,8 +157,7 @@ def get_session_info(agent: str) -> dict | None:
     if not sessions_file.exists():
         return None
 
-    with open(sessions_file) as f:
-        data = json.load(f)
+    data = _read_json(sessions_file)
 
     # Find the main (non-cron) session
     main_key = f"agent:{agent}:main"
@@ -108,143 +178,273 @@ def read_session_messages(agent: str, session_id: str) -> list[dict]:
         return []
 
     messages = []
-    with open(jsonl_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
+    loads = orjson.loads if orjson is not None else json.loads
+    bad_lines = 0
+    with open(jsonl_path, "rb") as f:
+        # Map the file so line iteration reads straight from the page cache
+        # instead of copying through Python's buffered-IO layer. Empty files
+        # can't be mapped, but they have nothing to parse anyway.
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return []
+        try:
+            for line in iter(mm.readline, b""):
+                # Records are always JSON objects; a one-byte preflight rejects
+                # blank and truncated lines without paying for a parse attempt
+                if line[:1] != b"{":
+                    if line.strip():
+                        bad_lines += 1
+                    continue
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    bad_lines += 1
+                    continue
                 if entry.get("type") == "message":
                     messages.append(entry)
-            except json.JSONDecodeError:
-                continue
+        finally:
+            mm.close()
 
+    if bad_lines:
+        print(f"  WARNING: Skipped {bad_lines} unparseable line(s) in {jsonl_path.name}")
     return messages
 
 
 def extract_text_from_messages(messages: list[dict]) -> list[dict]:
-    """Extract text content from session messages. Returns list of {role, text, timestamp}."""
+    """Extract text content from session messages. Returns list of {role, text, timestamp}.
+
+    Repeated toolResult payloads (re-read files, identical log tails) are
+    dropped after their first occurrence — they would only inflate the
+    embedding bill without adding recall signal.
+    """
     extracted = []
+    seen_tool_results = set()
+    append = extracted.append
+    blake2b = hashlib.blake2b
+
     for msg in messages:
-        m = msg.get("message", {})
-        role = m.get("role", "unknown")
-        timestamp = msg.get("timestamp", "")
+        m = msg.get("message")
+        if not m:
+            continue
         content = m.get("content", "")
 
-        text = ""
-        if isinstance(content, str):
+        if type(content) is str:
             text = content
-        elif isinstance(content, list):
-            parts = []
-            for part in content:
-                if isinstance(part, dict) and part.get("text"):
-                    parts.append(part["text"])
-            text = "\n".join(parts)
-
-        if text.strip():
-            extracted.append({
-                "role": role,
-                "text": text.strip(),
-                "timestamp": timestamp,
-            })
+        elif type(content) is list:
+            text = "\n".join(
+                p["text"] for p in content if type(p) is dict and p.get("text")
+            )
+        else:
+            continue
+
+        text = text.strip()
+        if not text:
+            continue
+
+        role = m.get("role", "unknown")
+        if role == "toolResult":
+            h = blake2b(text.encode(), digest_size=8).digest()
+            if h in seen_tool_results:
+                continue
+            seen_tool_results.add(h)
+
+        append({
+            "role": role,
+            "text": text,
+            "timestamp": msg.get("timestamp", ""),
+        })
 
     return extracted
 
 
 # ─── Chunking ─────────────────────────────────────────────────────────────────
 
+_ROLE_LABELS = {"user": "Human", "assistant": "Agent", "toolResult": "Tool"}
+
+
 def chunk_conversation(extracted: list[dict], chunk_size: int = CHUNK_SIZE,
                        overlap: int = CHUNK_OVERLAP) -> list[dict]:
     """Chunk conversation into embeddable pieces.
 
-    Groups consecutive messages, then splits long groups into chunks.
-    Each chunk is tagged with the roles and timestamp range it covers.
+    Streams over the messages once, flushing a chunk whenever the buffer
+    would overflow `chunk_size` and seeding the next chunk with the last
+    `overlap` chars for continuity. Each chunk is tagged with the roles
+    and timestamp range of the messages that actually contributed.
     """
     chunks = []
-
-    # Build conversation blocks (group 3-5 messages for context)
-    block_size = 4
-    for i in range(0, len(extracted), block_size):
-        block = extracted[i:i + block_size]
-
-        # Format as conversation
-        lines = []
-        for msg in block:
-            role_label = {"user": "Human", "assistant": "Agent", "toolResult": "Tool"}.get(
-                msg["role"], msg["role"].capitalize()
-            )
-            lines.append(f"[{role_label}]: {msg['text']}")
-
-        full_text = "\n\n".join(lines)
-
-        # Timestamp range
-        ts_start = block[0].get("timestamp", "")
-        ts_end = block[-1].get("timestamp", "")
-        roles_in_block = list(set(m["role"] for m in block))
-
-        # Split into chunks if too long
-        if len(full_text) <= chunk_size:
-            chunks.append({
-                "text": full_text,
-                "ts_start": ts_start,
-                "ts_end": ts_end,
-                "roles": roles_in_block,
-                "msg_range": f"{i}-{i + len(block) - 1}",
-            })
-        else:
-            # Sliding window
+    buf: list[str] = []
+    buf_len = 0
+    roles = set()
+    ts_start = ts_end = ""
+    msg_start = 0
+    pending = False  # buffer holds at least one real message (not just seed)
+
+    def flush(end_idx: int, seed_next: bool = True):
+        nonlocal buf, buf_len, roles, pending
+        text = "\n\n".join(buf)
+        chunks.append({
+            "text": text,
+            "ts_start": ts_start,
+            "ts_end": ts_end,
+            "roles": sorted(roles),
+            "msg_range": f"{msg_start}-{end_idx}",
+        })
+        seed = text[-overlap:] if overlap and seed_next else ""
+        buf = [seed] if seed else []
+        buf_len = len(seed)
+        roles = set()
+        pending = False
+
+    for idx, msg in enumerate(extracted):
+        role = msg["role"]
+        role_label = _ROLE_LABELS.get(role) or role.capitalize()
+        line = f"[{role_label}]: {msg['text']}"
+
+        if pending and buf_len + len(line) + 2 > chunk_size:
+            flush(idx - 1)
+
+        if not pending:
+            ts_start = msg.get("timestamp", "")
+            msg_start = idx
+        roles.add(role)
+        ts_end = msg.get("timestamp", "")
+        pending = True
+
+        if len(line) > chunk_size:
+            # A single oversized message still gets window-split. Stepping
+            # back by `overlap` supplies the seam continuity, so these
+            # flushes must not seed the next buffer as well — seeding on
+            # top of the step duplicated every seam twice and pushed
+            # chunks past chunk_size. Each window fills only the space
+            # left in the buffer, so the cap holds even after a seeded
+            # flush from the preceding messages.
             pos = 0
-            part_idx = 0
-            while pos < len(full_text):
-                end = min(pos + chunk_size, len(full_text))
-                chunk_text = full_text[pos:end]
-                chunks.append({
-                    "text": chunk_text,
-                    "ts_start": ts_start,
-                    "ts_end": ts_end,
-                    "roles": roles_in_block,
-                    "msg_range": f"{i}-{i + len(block) - 1} (part {part_idx})",
-                })
-                pos += chunk_size - overlap
-                part_idx += 1
+            while pos < len(line):
+                part = line[pos:pos + chunk_size - buf_len - (2 if buf else 0)]
+                buf.append(part)
+                buf_len += len(part) + 2
+                pos += len(part)
+                if pos < len(line):
+                    flush(idx, seed_next=False)
+                    if len(part) > overlap:
+                        pos -= overlap
+                    roles.add(role)
+                    pending = True
+        else:
+            buf.append(line)
+            buf_len += len(line) + 2
+
+    if pending:
+        flush(len(extracted) - 1)
 
     return chunks
 
 
 # ─── Embedding ────────────────────────────────────────────────────────────────
 
-def batch_embed(texts: list[str], batch_size: int = EMBED_BATCH) -> list[list[float] | None]:
-    """Embed texts in batches via Ollama. Returns vectors (or None for failures)."""
+async def _batch_embed_async(texts: list[str], batch_size: int) -> list[list[float] | None]:
     all_embeddings = [None] * len(texts)
+    sem = asyncio.Semaphore(EMBED_CONCURRENCY)
+    done = 0
+
+    limits = httpx.Limits(max_connections=EMBED_CONCURRENCY * 2)
+    async with httpx.AsyncClient(limits=limits, timeout=120) as client:
+
+        async def embed_batch(start: int):
+            nonlocal done
+            batch = texts[start:start + batch_size]
+            async with sem:
+                try:
+                    r = await client.post(
+                        f"{OLLAMA_URL}/api/embed",
+                        json={"model": EMBED_MODEL, "input": batch},
+                    )
+                    r.raise_for_status()
+                    vecs = r.json().get("embeddings", [])
+                    for j, vec in enumerate(vecs):
+                        all_embeddings[start + j] = vec
+                except Exception as e:
+                    print(f"\n  WARNING: Embedding batch {start // batch_size} failed: {e}")
+            done += len(batch)
+            print(f"\r  Embedded {done}/{len(texts)} ({done * 100 // len(texts)}%)", end="", flush=True)
+
+        await asyncio.gather(*(embed_batch(i) for i in range(0, len(texts), batch_size)))
 
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i:i + batch_size]
-        try:
-            r = httpx.post(
-                f"{OLLAMA_URL}/api/embed",
-                json={"model": EMBED_MODEL, "input": batch},
-                timeout=120,
-            )
-            r.raise_for_status()
-            vecs = r.json().get("embeddings", [])
-            for j, vec in enumerate(vecs):
-                all_embeddings[i + j] = vec
-        except Exception as e:
-            print(f"\n  WARNING: Embedding batch {i // batch_size} failed: {e}")
+    print()
+    return all_embeddings
 
-        done = min(i + batch_size, len(texts))
-        print(f"\r  Embedded {done}/{len(texts)} ({done * 100 // len(texts)}%)", end="", flush=True)
 
-    print()
+def _open_embed_cache() -> sqlite3.Connection:
+    EMBED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(EMBED_CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB)")
+    return conn
+
+
+def batch_embed(texts: list[str], batch_size: int = EMBED_BATCH) -> list[list[float] | None]:
+    """Embed texts in batches via Ollama, several batches in flight at once.
+
+    Texts already embedded on a previous run (retries, dry-run tuning) are
+    served from a local content-hash cache instead of hitting Ollama again.
+    Returns vectors in input order (or None for failures).
+    """
+    if not texts:
+        return []
+
+    jloads = orjson.loads if orjson is not None else json.loads
+    jdumps = orjson.dumps if orjson is not None else json.dumps
+
+    hashes = [hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts]
+    all_embeddings: list[list[float] | None] = [None] * len(texts)
+
+    try:
+        cache = _open_embed_cache()
+    except sqlite3.Error:
+        cache = None
+
+    if cache is not None:
+        found = {}
+        uniq = list(set(hashes))
+        for i in range(0, len(uniq), 500):
+            chunk = uniq[i:i + 500]
+            q = f"SELECT hash, vec FROM embeddings WHERE hash IN ({','.join('?' * len(chunk))})"
+            for h, vec in cache.execute(q, chunk):
+                found[h] = jloads(vec)
+        for i, h in enumerate(hashes):
+            if h in found:
+                all_embeddings[i] = found[h]
+        if found:
+            hits = sum(1 for e in all_embeddings if e is not None)
+            print(f"  Embed cache: {hits}/{len(texts)} chunks already embedded")
+
+    to_embed = [i for i, e in enumerate(all_embeddings) if e is None]
+    if to_embed:
+        run = uvloop.run if uvloop is not None else asyncio.run
+        vecs = run(_batch_embed_async([texts[i] for i in to_embed], batch_size))
+        new_rows = []
+        for idx, vec in zip(to_embed, vecs):
+            all_embeddings[idx] = vec
+            if vec is not None:
+                new_rows.append((hashes[idx], jdumps(vec)))
+        if cache is not None and new_rows:
+            cache.executemany(
+                "INSERT OR IGNORE INTO embeddings (hash, vec) VALUES (?, ?)", new_rows
+            )
+            cache.commit()
+
+    if cache is not None:
+        cache.close()
     return all_embeddings
 
 
 # ─── LanceDB storage ─────────────────────────────────────────────────────────
 
 def store_to_lancedb(records: list[dict], dry_run: bool = False) -> int:
-    """Store session history records to LanceDB."""
+    """Store session history records to LanceDB as one Arrow batch."""
     import lancedb
+    import numpy as np  # pyarrow dependency, so always present alongside it
+    import pyarrow as pa
 
     if dry_run:
         print(f"  [DRY RUN] Would store {len(records)} records")
@@ -252,24 +452,39 @@ def store_to_lancedb(records: list[dict], dry_run: bool = False) -> int:
             print(f"    {r['text'][:120]}...")
         return 0
 
+    if not records:
+        return 0
+
     db = lancedb.connect(str(LANCEDB_PATH))
     tbl = db.open_table("memories")
 
-    existing = tbl.count_rows()
-    print(f"  Existing LanceDB records: {existing:,}")
-
-    STORE_BATCH = 500
-    stored = 0
-    for i in range(0, len(records), STORE_BATCH):
-        batch = records[i:i + STORE_BATCH]
-        tbl.add(batch)
-        stored += len(batch)
-        print(f"\r  Stored {stored}/{len(records)}", end="", flush=True)
+    # One fragment instead of one per 500-row slice — a single add() writes
+    # one file and skips the per-batch schema coercion.
+    # Pack vectors as one contiguous float32 matrix so Arrow ingests the
+    # buffer zero-copy instead of converting floats one Python object at a time
+    vec_matrix = np.asarray([r["vector"] for r in records], dtype=np.float32)
+    dim = vec_matrix.shape[1]
+    flat = pa.array(vec_matrix.ravel(), type=pa.float32())
+    arrow = pa.table({
+        "id": pa.array([r["id"] for r in records]),
+        "text": pa.array([r["text"] for r in records]),
+        "vector": pa.FixedSizeListArray.from_arrays(flat, dim),
+        "importance": pa.array([r["importance"] for r in records]),
+        "category": pa.array([r["category"] for r in records]),
+        "createdAt": pa.array([r["createdAt"] for r in records]),
+    })
+    tbl.add(arrow)
+    print(f"  Stored {len(records)} records in one batch")
+
+    # One compaction/index refresh after the bulk load, rather than letting
+    # each fragment trigger incremental index maintenance mid-insert
+    try:
+        tbl.optimize()
+    except Exception:
+        pass  # older lancedb without optimize() — fragments compact lazily
 
-    print()
-    new_total = tbl.count_rows()
-    print(f"  New total: {new_total:,} (+{new_total - existing})")
-    return stored
+    print(f"  Total rows: {tbl.count_rows():,}")
+    return len(records)
 
 
 # ─── Agent self-summary ───────────────────────────────────────────────────────
@@ -278,9 +493,9 @@ def request_agent_summary(agent: str) -> bool:
     """Ask the agent to store their own summary of active context via Hermes."""
     print(f"\n  Requesting self-summary from {agent}...")
     try:
-        r = httpx.post(
+        r = _post_json(
             f"{HERMES_URL}/api/v1/agent/ask",
-            json={
+            {
                 "caller_id": "compaction",
                 "target_agent": agent,
                 "message": SELF_SUMMARY_PROMPT,
@@ -304,6 +519,22 @@ def request_agent_summary(agent: str) -> bool:
 
 # ─── Session rotation ─────────────────────────────────────────────────────────
 
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy src to dst, preserving mtime. Uses sendfile (zero-copy) when available."""
+    if not hasattr(os, "sendfile"):
+        shutil.copy2(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        st = os.fstat(fsrc.fileno())
+        offset, size = 0, st.st_size
+        while offset < size:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def archive_session(agent: str, session_id: str, dry_run: bool = False) -> str | None:
     """Archive the session JSONL and remove from sessions.json."""
     jsonl_path = AGENTS_DIR / agent / "sessions" / f"{session_id}.jsonl"
@@ -324,20 +555,18 @@ def archive_session(agent: str, session_id: str, dry_run: bool = False) -> str |
         return str(archive_path)
 
     # Copy (not move) — let the runtime handle the active file
-    shutil.copy2(jsonl_path, archive_path)
+    _copy_file(jsonl_path, archive_path)
     print(f"  Archived: {archive_path}")
 
     # Clear the session from sessions.json to force a fresh start
     sessions_file = AGENTS_DIR / agent / "sessions" / "sessions.json"
     try:
-        with open(sessions_file) as f:
-            data = json.load(f)
+        data = _read_json(sessions_file)
 
         main_key = f"agent:{agent}:main"
         if main_key in data:
             del data[main_key]
-            with open(sessions_file, "w") as f:
-                json.dump(data, f, indent=2)
+            _write_json(sessions_file, data)
             print(f"  Cleared session key '{main_key}' from sessions.json")
     except Exception as e:
         print(f"  WARNING: Could not update sessions.json: {e}")
@@ -354,19 +583,30 @@ def archive_session(agent: str, session_id: str, dry_run: bool = False) -> str |
 
 # ─── Main pipeline ────────────────────────────────────────────────────────────
 
-def compact(agent: str, threshold: int, dry_run: bool, force: bool,
-            skip_summary: bool, skip_archive: bool) -> bool:
-    """Run the full compaction pipeline for one agent."""
-    print(f"\n{'='*60}")
-    print(f"  SESSION COMPACTION: {agent}")
-    print(f"  Threshold: {threshold:,} tokens")
-    print(f"{'='*60}")
+def should_compact(agent: str, threshold: int, force: bool) -> dict | None:
+    """Cheap metadata-only eligibility check (Step 1).
 
-    # Step 1: Check session size
+    Reads sessions.json without touching the session JSONL. Returns the
+    session info dict when the agent qualifies for compaction, else None.
+    """
     info = get_session_info(agent)
     if not info:
-        print(f"  No active main session for {agent}")
-        return False
+        print(f"  {agent}: no active main session")
+        return None
+
+    tokens = info.get("totalTokens", info.get("inputTokens", 0))
+    if not force and tokens < threshold:
+        print(f"  {agent}: {tokens:,} tokens — below threshold ({threshold:,})")
+        return None
+    return info
+
+
+def do_compact(agent: str, info: dict, dry_run: bool,
+               skip_summary: bool, skip_archive: bool) -> bool:
+    """Run the heavy compaction pipeline (Steps 2-10) for a qualifying agent."""
+    print(f"\n{'='*60}")
+    print(f"  SESSION COMPACTION: {agent}")
+    print(f"{'='*60}")
 
     tokens = info.get("totalTokens", info.get("inputTokens", 0))
     session_id = info.get("sessionId", "")
@@ -376,12 +616,6 @@ def compact(agent: str, threshold: int, dry_run: bool, force: bool,
     print(f"  Session: {session_id}")
     print(f"  Tokens:  {tokens:,} / {ctx:,} ({pct}%)")
 
-    if not force and tokens < threshold:
-        print(f"  Below threshold ({threshold:,}) — skipping")
-        return False
-
-    print(f"  ABOVE THRESHOLD — proceeding with compaction")
-
     # Step 2: Read and extract conversation text
     print(f"\n  Reading session messages...")
     messages = read_session_messages(agent, session_id)
@@ -441,30 +675,28 @@ def compact(agent: str, threshold: int, dry_run: bool, force: bool,
         print(f"\n  Skipping archive (--skip-archive)")
         archive_path = None
 
-    # Step 9: Emit event for n8n
+    # Step 9: Emit event for n8n (fire-and-forget — don't block the pipeline
+    # up to 5s on a non-critical notification)
     if not dry_run:
-        try:
-            httpx.post(f"{HERMES_URL}/api/v1/events", json={
-                "event_type": "session.compacted",
-                "source": "compact_session",
-                "payload": {
-                    "agent": agent,
-                    "session_id": session_id,
-                    "original_tokens": tokens,
-                    "chunks_stored": len(records),
-                    "archive_path": archive_path,
-                },
-            }, timeout=5)
-        except Exception:
-            pass  # non-critical
+        _emit_event({
+            "event_type": "session.compacted",
+            "source": "compact_session",
+            "payload": {
+                "agent": agent,
+                "session_id": session_id,
+                "original_tokens": tokens,
+                "chunks_stored": len(records),
+                "archive_path": archive_path,
+            },
+        })
 
     # Step 10: Send reacquaintance message to the fresh session
     if not skip_archive and not dry_run:
         print(f"\n  Sending reacquaintance message to fresh session...")
         try:
-            r = httpx.post(
+            r = _post_json(
                 f"{HERMES_URL}/api/v1/agent/ask",
-                json={
+                {
                     "caller_id": "compaction",
                     "target_agent": agent,
                     "message": REACQUAINT_PROMPT,
@@ -508,12 +740,32 @@ def main():
         parser.error("Specify --agent NAME or --all")
 
     agents = ALL_AGENTS if args.all else [args.agent]
-    compacted = 0
 
-    for agent in agents:
-        if compact(agent, args.threshold, args.dry_run, args.force,
-                   args.skip_summary, args.skip_archive):
-            compacted += 1
+    # Cheap metadata pass first — with --all most agents are usually under
+    # threshold, so this skips them without reading any session JSONL.
+    print(f"  Checking {len(agents)} agent(s) against threshold {args.threshold:,}...")
+    qualifying = [
+        (agent, info) for agent in agents
+        if (info := should_compact(agent, args.threshold, args.force)) is not None
+    ]
+
+    # Each agent's pipeline is dominated by blocking IO (session read, embed
+    # calls, archive copy), so under --all a small process pool overlaps them.
+    # Workers stay bounded — the embed calls all land on the same Ollama.
+    if args.all and len(qualifying) > 1:
+        with ProcessPoolExecutor(max_workers=min(COMPACT_WORKERS, len(qualifying))) as pool:
+            futures = [
+                pool.submit(do_compact, agent, info, args.dry_run,
+                            args.skip_summary, args.skip_archive)
+                for agent, info in qualifying
+            ]
+            compacted = sum(1 for f in futures if f.result())
+    else:
+        compacted = 0
+        for agent, info in qualifying:
+            if do_compact(agent, info, args.dry_run,
+                          args.skip_summary, args.skip_archive):
+                compacted += 1
 
     print(f"\n{'='*60}")
     print(f"  Done. Compacted {compacted}/{len(agents)} agent(s).")
@@ -16,6 +16,7 @@ import sys
 import json
 import time
 import argparse
+import asyncio
 from datetime import datetime, timezone
 
 try:
@@ -62,12 +63,12 @@ SERVICES = {
 }
 
 
-def check_http(name: str, base_url: str, path: str, timeout: float = 5.0) -> dict:
+async def check_http(client: "httpx.AsyncClient", name: str, base_url: str, path: str) -> dict:
     """Check an HTTP service."""
     url = f"{base_url}{path}"
     start = time.monotonic()
     try:
-        resp = httpx.get(url, timeout=timeout)
+        resp = await client.get(url)
         latency_ms = (time.monotonic() - start) * 1000
         return {
             "name": name,
@@ -83,10 +84,10 @@ def check_http(name: str, base_url: str, path: str, timeout: float = 5.0) -> dic
         return {"name": name, "status": "down", "error": str(e)}
 
 
-def check_ollama_models() -> dict:
+async def check_ollama_models(client: "httpx.AsyncClient") -> dict:
     """Check which embedding models are loaded in Ollama."""
     try:
-        resp = httpx.get(f"{SERVICES['ollama']['url']}/api/tags", timeout=5.0)
+        resp = await client.get(f"{SERVICES['ollama']['url']}/api/tags")
         models = [m["name"] for m in resp.json().get("models", [])]
         embed_models = [m for m in models if "embed" in m.lower()]
         return {"loaded_models": len(models), "embed_models": embed_models}
@@ -94,10 +95,10 @@ def check_ollama_models() -> dict:
         return {"loaded_models": 0, "embed_models": []}
 
 
-def check_qdrant_collections() -> dict:
+async def check_qdrant_collections(client: "httpx.AsyncClient") -> dict:
     """Check Qdrant collections and point counts."""
     try:
-        resp = httpx.get(f"{SERVICES['qdrant']['url']}/collections", timeout=5.0)
+        resp = await client.get(f"{SERVICES['qdrant']['url']}/collections")
         data = resp.json().get("result", {}).get("collections", [])
         collections = {}
         for c in data:
@@ -108,10 +109,10 @@ def check_qdrant_collections() -> dict:
         return {"collections": {}, "error": str(e)}
 
 
-def check_bridge_deep() -> dict:
+async def check_bridge_deep(client: "httpx.AsyncClient") -> dict:
     """Get Lazarus Bridge health details including Postgres status."""
     try:
-        resp = httpx.get(f"{SERVICES['lazarus_bridge']['url']}/health", timeout=5.0)
+        resp = await client.get(f"{SERVICES['lazarus_bridge']['url']}/health")
         data = resp.json()
         return {
             "postgres": data.get("postgres", "unknown"),
@@ -122,20 +123,32 @@ def check_bridge_deep() -> dict:
         return {"postgres": "unknown", "qdrant": "unknown"}
 
 
+async def _probe_all():
+    """Fan out every probe concurrently over one connection pool."""
+    http_probes = [
+        (name, svc) for name, svc in SERVICES.items()
+        if svc["url"] and svc["check"] != "bridge"
+    ]
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        gathered = await asyncio.gather(
+            *(check_http(client, name, svc["url"], svc["check"]) for name, svc in http_probes),
+            check_ollama_models(client),
+            check_qdrant_collections(client),
+            check_bridge_deep(client),
+        )
+
+    n = len(http_probes)
+    results = list(gathered[:n])
+    for (_, svc), result in zip(http_probes, results):
+        result["critical"] = svc["critical"]
+    ollama_info, qdrant_info, bridge_info = gathered[n:]
+    return results, ollama_info, qdrant_info, bridge_info
+
+
 def run_healthcheck(as_json: bool = False) -> dict:
     """Run full health check across all services."""
     timestamp = datetime.now(timezone.utc).isoformat()
-    results = []
-
-    for name, svc in SERVICES.items():
-        if svc["url"] and svc["check"] != "bridge":
-            result = check_http(name, svc["url"], svc["check"])
-            result["critical"] = svc["critical"]
-            results.append(result)
-
-    ollama_info = check_ollama_models()
-    qdrant_info = check_qdrant_collections()
-    bridge_info = check_bridge_deep()
+    results, ollama_info, qdrant_info, bridge_info = asyncio.run(_probe_all())
 
     pg_status = bridge_info.get("postgres", "unknown")
     results.append({
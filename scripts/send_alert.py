@@ -19,10 +19,13 @@ Python Usage:
 import sys
 import os
 import json
+import asyncio
 import argparse
+import threading
 from datetime import datetime, timezone
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from functools import lru_cache
+
+from _http_pool import post_json as _post_json, TIMEOUT_SECONDS
 
 # n8n webhook endpoints — localhost first, Docker fallback
 WEBHOOK_URLS = [
@@ -31,28 +34,28 @@ WEBHOOK_URLS = [
 ]
 
 VALID_SEVERITIES = ("info", "warning", "critical")
+_SEV_SET = frozenset(VALID_SEVERITIES)
+_SEV_MARK = {"info": "[i]", "warning": "[!]", "critical": "[!!!]"}
 
-TIMEOUT_SECONDS = 15
 
+@lru_cache(maxsize=64)
+def _payload_prefix(agent_name: str, severity: str) -> bytes:
+    """Pre-serialized JSON opening for the fields that repeat across a burst."""
+    return json.dumps({"agent": agent_name, "severity": severity})[:-1].encode("utf-8")
 
-def _post_json(url: str, payload: dict, timeout: int = TIMEOUT_SECONDS) -> tuple[int, str]:
-    """POST JSON to a URL using stdlib. Returns (status_code, response_body)."""
-    data = json.dumps(payload).encode("utf-8")
-    req = Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-            return resp.status, body
-    except HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace") if e.fp else str(e)
-        return e.code, body
-    except URLError as e:
-        raise ConnectionError(f"Cannot reach {url}: {e.reason}") from e
+
+def _build_payload(agent_name: str, severity: str, title: str,
+                   details: str, tags: list[str] | None) -> bytes:
+    # Agents often fire bursts of similar alerts — serialize the constant
+    # (agent, severity) opening once per process and only dump the rest
+    tail = {
+        "title": title,
+        "details": details,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    if tags:
+        tail["tags"] = tags
+    return _payload_prefix(agent_name, severity) + b"," + json.dumps(tail).encode("utf-8")[1:]
 
 
 def send_alert(
@@ -76,18 +79,10 @@ def send_alert(
         (success: bool, message: str)
     """
     severity = severity.lower().strip()
-    if severity not in VALID_SEVERITIES:
+    if severity not in _SEV_SET:
         return False, f"Invalid severity '{severity}'. Must be one of: {', '.join(VALID_SEVERITIES)}"
 
-    payload = {
-        "agent": agent_name,
-        "severity": severity,
-        "title": title,
-        "details": details,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
-    if tags:
-        payload["tags"] = tags
+    payload = _build_payload(agent_name, severity, title, details, tags)
 
     last_error = None
     for url in WEBHOOK_URLS:
@@ -104,7 +99,173 @@ def send_alert(
     return False, f"All endpoints failed. Last error: {last_error}"
 
 
-def main() -> int:
+def send_alerts_bulk(alerts: list[dict]) -> tuple[bool, str]:
+    """
+    Send many alerts as a single webhook request.
+
+    Each dict needs at least agent/severity/title; details, tags and
+    timestamp are optional (timestamp defaults to now). Posts one
+    {"alerts": [...]} body, so N alerts cost one round trip — the n8n
+    workflow must iterate items[0].json.alerts.
+
+    Returns:
+        (success: bool, message: str)
+    """
+    if not alerts:
+        return True, "No alerts to send"
+
+    now = datetime.now(timezone.utc).isoformat()
+    stamped = []
+    for a in alerts:
+        severity = a.get("severity", "info").lower().strip()
+        if severity not in _SEV_SET:
+            return False, f"Invalid severity '{severity}'. Must be one of: {', '.join(VALID_SEVERITIES)}"
+        entry = {
+            "agent": a.get("agent", "unknown"),
+            "severity": severity,
+            "title": a.get("title", ""),
+            "details": a.get("details", ""),
+            "timestamp": a.get("timestamp", now),
+        }
+        if a.get("tags"):
+            entry["tags"] = a["tags"]
+        stamped.append(entry)
+
+    last_error = None
+    for url in WEBHOOK_URLS:
+        try:
+            status, resp_body = _post_json(url, {"alerts": stamped})
+            if 200 <= status < 300:
+                return True, f"{len(stamped)} alert(s) sent via {url} (HTTP {status})"
+            last_error = f"HTTP {status} from {url}: {resp_body}"
+        except ConnectionError as e:
+            last_error = str(e)
+            continue
+
+    return False, f"All endpoints failed. Last error: {last_error}"
+
+
+class _Batcher:
+    """Coalesces alerts into bulk posts: flushes at 32 alerts or after 250 ms."""
+
+    MAX_BATCH = 32
+    FLUSH_AFTER = 0.25
+
+    def __init__(self):
+        self._buf: list[dict] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def add(self, alert: dict) -> None:
+        with self._lock:
+            self._buf.append(alert)
+            if len(self._buf) >= self.MAX_BATCH:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_AFTER, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buf:
+            buf, self._buf = self._buf, []
+            send_alerts_bulk(buf)
+
+
+#: Shared batcher for high-rate callers: BATCHER.add({...}); low-rate callers
+#: should keep using send_alert() directly.
+BATCHER = _Batcher()
+
+
+# ── Async variants — for agents already running an event loop ────────────
+
+_async_client = None
+_alert_queue: "asyncio.Queue | None" = None
+_drain_task = None
+
+
+def _get_async_client():
+    global _async_client
+    if _async_client is None:
+        import httpx  # only needed by the async path; sync path stays stdlib
+        _async_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=TIMEOUT_SECONDS,
+        )
+    return _async_client
+
+
+async def send_alert_async(
+    agent_name: str,
+    severity: str,
+    title: str,
+    details: str = "",
+    tags: list[str] | None = None,
+) -> tuple[bool, str]:
+    """Async counterpart of send_alert — same validation, fallback and result."""
+    severity = severity.lower().strip()
+    if severity not in _SEV_SET:
+        return False, f"Invalid severity '{severity}'. Must be one of: {', '.join(VALID_SEVERITIES)}"
+
+    payload = _build_payload(agent_name, severity, title, details, tags)
+    client = _get_async_client()
+
+    last_error = None
+    for url in WEBHOOK_URLS:
+        try:
+            r = await client.post(
+                url, content=payload, headers={"Content-Type": "application/json"}
+            )
+            if 200 <= r.status_code < 300:
+                return True, f"Alert sent successfully via {url} (HTTP {r.status_code})"
+            last_error = f"HTTP {r.status_code} from {url}: {r.text}"
+        except Exception as e:
+            last_error = str(e)
+            continue
+
+    return False, f"All endpoints failed. Last error: {last_error}"
+
+
+def send_alert_nowait(
+    agent_name: str,
+    severity: str,
+    title: str,
+    details: str = "",
+    tags: list[str] | None = None,
+) -> None:
+    """Fire-and-forget: enqueue the alert and return immediately.
+
+    Must be called from inside a running event loop. A single background
+    task drains the queue, so N alerts cost ~one webhook RTT of wall time
+    instead of N.
+    """
+    global _alert_queue, _drain_task
+    loop = asyncio.get_running_loop()
+    if _alert_queue is None:
+        _alert_queue = asyncio.Queue()
+        _drain_task = loop.create_task(_drain_alerts())
+    _alert_queue.put_nowait((agent_name, severity, title, details, tags))
+
+
+async def _drain_alerts():
+    while True:
+        args = await _alert_queue.get()
+        try:
+            await send_alert_async(*args)
+        except Exception:
+            pass  # fire-and-forget — never propagate into the caller's loop
+        _alert_queue.task_done()
+
+
+@lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Send agent alert via n8n webhook",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -126,8 +287,11 @@ def main() -> int:
     parser.add_argument("--details", default="", help="Longer description or context")
     parser.add_argument("--tags", help="Comma-separated tags for filtering (e.g. disk,infra)")
     parser.add_argument("--json", action="store_true", help="Output result as JSON")
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> int:
+    args = _parser().parse_args()
 
     tags = [t.strip() for t in args.tags.split(",") if t.strip()] if args.tags else None
 
@@ -143,7 +307,7 @@ def main() -> int:
         print(json.dumps({"success": ok, "message": msg}))
     else:
         prefix = "OK" if ok else "FAIL"
-        severity_marker = {"info": "[i]", "warning": "[!]", "critical": "[!!!]"}[args.severity]
+        severity_marker = _SEV_MARK[args.severity]
         print(f"{prefix} {severity_marker}: {msg}")
 
     return 0 if ok else 1
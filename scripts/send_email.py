@@ -21,8 +21,9 @@ import os
 import json
 import argparse
 from datetime import datetime, timezone
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from functools import lru_cache
+
+from _http_pool import post_json as _post_json
 
 # n8n webhook endpoints — localhost first, Docker fallback
 WEBHOOK_URLS = [
@@ -30,28 +31,6 @@ WEBHOOK_URLS = [
     "http://n8n:5678/webhook/send-email",
 ]
 
-TIMEOUT_SECONDS = 15
-
-
-def _post_json(url: str, payload: dict, timeout: int = TIMEOUT_SECONDS) -> tuple[int, str]:
-    """POST JSON to a URL using stdlib. Returns (status_code, response_body)."""
-    data = json.dumps(payload).encode("utf-8")
-    req = Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-            return resp.status, body
-    except HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace") if e.fp else str(e)
-        return e.code, body
-    except URLError as e:
-        raise ConnectionError(f"Cannot reach {url}: {e.reason}") from e
-
 
 def send_email(
     to: str,
@@ -112,7 +91,8 @@ def send_test_email(agent_name: str = "test") -> tuple[bool, str]:
     )
 
 
-def main() -> int:
+@lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Send email via n8n webhook",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -131,7 +111,11 @@ def main() -> int:
     parser.add_argument("--agent", default="unknown", help="Agent name for audit trail (default: unknown)")
     parser.add_argument("--test", action="store_true", help="Send a test email to verify connectivity")
     parser.add_argument("--json", action="store_true", help="Output result as JSON")
+    return parser
 
+
+def main() -> int:
+    parser = _parser()
     args = parser.parse_args()
 
     # Test mode
@@ -28,11 +28,21 @@ import os
 import re
 import shutil
 import subprocess
+import fcntl
+import hashlib
 import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional — scanner output parsing falls back to stdlib
+    orjson = None
+
 # ── Paths ────────────────────────────────────────────────────────────────
 
 SUPERCLAW_HOME = Path(os.environ.get("SUPERCLAW_HOME", Path.home() / ".superclaw"))
@@ -43,16 +53,24 @@ if not SUPERCLAW_HOME.exists():
 WORKSPACE = SUPERCLAW_HOME / "workspace"
 SKILLS_DIR = WORKSPACE / "skills"
 QUARANTINE_DIR = WORKSPACE / "quarantine"
-SCAN_REGISTRY = WORKSPACE / "memory" / "skill_scans.json"
+SCAN_REGISTRY = WORKSPACE / "memory" / "skill_scans.json"  # legacy, read-only
+SCAN_LOG = SCAN_REGISTRY.with_suffix(".jsonl")
+SCAN_CACHE = WORKSPACE / "memory" / "scan_cache.json"
 
 # ── Rename Mappings ──────────────────────────────────────────────────────
 
-RENAME_PATTERNS = [
-    (r"~/\.openclaw/", "~/.superclaw/"),
-    (r"\.openclaw/", ".superclaw/"),
-    (r"openclaw\.json", "superclaw.json"),
-    (r"OPENCLAW_", "SUPERCLAW_"),
-]
+RENAME_MAP = {
+    "~/.openclaw/": "~/.superclaw/",
+    ".openclaw/": ".superclaw/",
+    "openclaw.json": "superclaw.json",
+    "OPENCLAW_": "SUPERCLAW_",
+}
+
+# One alternation covering every mapping, longest-first so "~/.openclaw/"
+# wins over ".openclaw/" — a single pass per file instead of one per pattern
+_RENAME_RX = re.compile(
+    "|".join(re.escape(k) for k in sorted(RENAME_MAP, key=len, reverse=True))
+)
 
 # File extensions to process for renames
 TEXT_EXTENSIONS = {
@@ -60,13 +78,39 @@ TEXT_EXTENSIONS = {
     ".yaml", ".yml", ".toml", ".txt", ".cfg", ".ini", ".env",
 }
 
+# Anything bigger than this is a data asset, not renameable source
+MAX_RENAME_BYTES = 2_000_000
+
 
 # ── Utilities ────────────────────────────────────────────────────────────
 
+# [whole-second epoch, formatted string] — the renamer can log dozens of
+# lines a second, and strftime costs more than the print itself
+_ts_cache = [0, ""]
+
+
 def log(msg, level="INFO"):
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[:] = [sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))]
     symbol = {"OK": "+", "WARN": "!", "ERROR": "x", "INFO": "*"}
-    print(f"[{ts}] [{symbol.get(level, '*')}] {msg}")
+    print(f"[{_ts_cache[1]}] [{symbol.get(level, '*')}] {msg}")
+
+
+def _clone_tree(src, dst):
+    """Recursive copy that clones extents (reflink) where the filesystem allows.
+
+    On btrfs/xfs the clone is O(1) per file regardless of size; cp falls
+    back to a real copy elsewhere, and we fall back to copytree if cp
+    itself is unavailable.
+    """
+    try:
+        subprocess.run(
+            ["cp", "--reflink=auto", "-r", str(src), str(dst)],
+            check=True, capture_output=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        shutil.copytree(src, dst)
 
 
 def ensure_dirs():
@@ -74,84 +118,222 @@ def ensure_dirs():
     SCAN_REGISTRY.parent.mkdir(parents=True, exist_ok=True)
 
 
-def load_registry():
-    if SCAN_REGISTRY.exists():
+def append_registry(entry):
+    """Append one scan record to the JSONL log.
+
+    O(1) per scan instead of rewriting the whole registry; flock keeps
+    concurrent cron/install runs from interleaving lines.
+    """
+    line = (json.dumps(entry) + "\n").encode("utf-8")
+    with open(SCAN_LOG, "ab") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
         try:
-            return json.loads(SCAN_REGISTRY.read_text())
-        except json.JSONDecodeError:
-            return {"scans": [], "version": 1}
-    return {"scans": [], "version": 1}
+            f.write(line)
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
 
+def _tail_entries(limit=25):
+    """Read the last `limit` log records by scanning backwards in 8 KB chunks."""
+    try:
+        with open(SCAN_LOG, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            data = b""
+            while end > 0 and data.count(b"\n") <= limit:
+                step = min(8192, end)
+                end -= step
+                f.seek(end)
+                data = f.read(step) + data
+    except OSError:
+        return []
 
-def save_registry(registry):
-    tmp = SCAN_REGISTRY.with_suffix(".tmp")
-    tmp.write_text(json.dumps(registry, indent=2))
-    tmp.replace(SCAN_REGISTRY)
+    entries = []
+    for raw in data.splitlines()[-limit:]:
+        try:
+            entries.append(json.loads(raw))
+        except json.JSONDecodeError:
+            continue
+    return entries
 
 
 # ── Scanner ──────────────────────────────────────────────────────────────
 
-def run_scanner(skill_path, use_behavioral=True):
+# Resolve once — an absolute argv[0] also lets execve skip the PATH search
+_SCANNER_BIN = shutil.which("skill-scanner")
+
+
+def _hash_file(p):
+    """Digest a file's bytes — chunked reads, no decode.
+
+    hashlib.file_digest does the chunking C-side but only exists on
+    3.11+; the repo supports 3.10, so fall back to a Python read loop.
+    """
+    with open(p, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fh, "blake2b").hexdigest()
+        h = hashlib.blake2b()
+        while chunk := fh.read(1 << 20):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _skill_fingerprint(p):
+    """Merkle-style content fingerprint of a skill directory.
+
+    Hashes actual file bytes rather than (size, mtime) so clones, rsyncs
+    and touch-only changes don't force a pointless re-scan.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for f in sorted(Path(p).rglob("*")):
+        if f.is_file():
+            h.update(f"{f.relative_to(p)}|{_hash_file(f)}\n".encode())
+    return h.hexdigest()
+
+
+def _load_scan_cache():
+    try:
+        return json.loads(SCAN_CACHE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_scan_cache(cache):
+    tmp = SCAN_CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache))
+    tmp.replace(SCAN_CACHE)
+
+
+def run_scanner(skill_path, use_behavioral=True, use_cache=False):
     """
     Run Cisco skill-scanner on a skill directory.
     Returns (clean: bool, findings: list, raw_output: str).
+
+    With use_cache, an unchanged skill (same directory fingerprint as the
+    last run) reuses the stored verdict and skips the subprocess entirely —
+    the dominant cost of a cron sweep.
     """
-    cmd = ["skill-scanner", "scan", str(skill_path), "--format", "json"]
+    fingerprint = None
+    if use_cache:
+        fingerprint = _skill_fingerprint(skill_path)
+        hit = _load_scan_cache().get(str(skill_path))
+        if hit is not None and hit.get("fingerprint") == fingerprint:
+            return (hit["clean"], hit["findings"], "cached")
+
+    if _SCANNER_BIN is None:
+        log("skill-scanner not installed. Run: pip install cisco-ai-skill-scanner", "ERROR")
+        return (False, [], "skill-scanner binary not found")
+
+    cmd = [_SCANNER_BIN, "scan", str(skill_path), "--format", "json"]
     if use_behavioral:
         cmd.append("--use-behavioral")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        output = result.stdout.strip()
-
-        try:
-            data = json.loads(output)
-            finding_list = data if isinstance(data, list) else data.get("findings", [])
-            has_critical = any(
-                f.get("severity", "").lower() in ("critical", "high")
-                for f in finding_list
-            )
-            return (not has_critical, finding_list, output)
-        except json.JSONDecodeError:
-            # Fall back to exit code
-            return (result.returncode == 0, [], output)
-
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
     except FileNotFoundError:
+        # Binary vanished after import-time resolution
         log("skill-scanner not installed. Run: pip install cisco-ai-skill-scanner", "ERROR")
         return (False, [], "skill-scanner binary not found")
+
+    # communicate() keeps the 120s ceiling over the whole read — a hung
+    # scanner that holds its pipe open gets killed, not waited on forever.
+    # Output stays bytes (no text-mode decode or strip) for orjson.
+    try:
+        raw_bytes, _ = proc.communicate(timeout=120)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
         log("Scan timed out after 120s", "ERROR")
         return (False, [], "timeout")
 
+    try:
+        data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
+    except ValueError:
+        data = None
+
+    if data is not None:
+        finding_list = data if isinstance(data, list) else data.get("findings", [])
+        has_critical = any(
+            f.get("severity", "").lower() in ("critical", "high")
+            for f in finding_list
+        )
+        if fingerprint is not None:
+            # Reload-merge-save so concurrent workers don't drop each other
+            cache = _load_scan_cache()
+            cache[str(skill_path)] = {
+                "fingerprint": fingerprint,
+                "clean": not has_critical,
+                "findings": finding_list,
+            }
+            _save_scan_cache(cache)
+        return (not has_critical, finding_list, "")
+
+    # Fall back to exit code when the output wasn't JSON
+    return (proc.returncode == 0, [], "")
+
 
 # ── Renamer ──────────────────────────────────────────────────────────────
 
+def _rewrite_one(skill_path, fpath):
+    """Rewrite refs in one file. Returns its relative path if modified, else None."""
+    try:
+        size = fpath.stat().st_size
+        if size > MAX_RENAME_BYTES:
+            return None
+        # Sniff the first page: skip binaries mislabeled with a text
+        # extension, and small files whose head shows no refs at all
+        with fpath.open("rb") as fh:
+            head = fh.read(4096)
+        if b"\x00" in head:
+            return None
+        if size <= 4096 and b"openclaw" not in head and b"OPENCLAW_" not in head:
+            return None
+        # One open for read and (only if needed) the rewrite — unchanged
+        # files never touch the write path
+        with fpath.open("r+", encoding="utf-8") as fh:
+            content = fh.read()
+            # Cheap substring probe before the regex — most files have no refs
+            if "openclaw" not in content and "OPENCLAW_" not in content:
+                return None
+            new = _RENAME_RX.sub(lambda m: RENAME_MAP[m.group(0)], content)
+            if new == content:
+                return None
+            fh.seek(0)
+            fh.write(new)
+            fh.truncate()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    return str(fpath.relative_to(skill_path))
+
+
+def _walk_text_files(root):
+    """Yield every text-extension file under root, skipping dot-directories.
+
+    The single shared traversal for the Python side of the pipeline —
+    scandir-backed, no per-entry is_file() stat, and pruning dirs in place
+    stops the walk from ever entering .git etc.
+    """
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if os.path.splitext(name)[1].lower() in TEXT_EXTENSIONS:
+                yield Path(dirpath, name)
+
+
 def rename_openclaw_refs(skill_path):
     """Rename all openclaw references to superclaw in text files."""
-    renamed_files = []
     skill_path = Path(skill_path)
+    candidates = list(_walk_text_files(skill_path))
 
-    for fpath in skill_path.rglob("*"):
-        if not fpath.is_file():
-            continue
-        if fpath.suffix.lower() not in TEXT_EXTENSIONS:
-            continue
-        # Skip hidden dirs like .git
-        if any(part.startswith(".") for part in fpath.relative_to(skill_path).parts[:-1]):
-            continue
+    # Each rewrite is independent and IO-bound — overlap them with threads.
+    # Logging happens after the map so output order stays deterministic.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(partial(_rewrite_one, skill_path), candidates))
 
-        try:
-            content = fpath.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            continue
-
-        original = content
-        for pattern, replacement in RENAME_PATTERNS:
-            content = re.sub(re.escape(pattern) if not pattern.startswith(r"~") else pattern, replacement, content)
-
-        if content != original:
-            fpath.write_text(content, encoding="utf-8")
-            rel = str(fpath.relative_to(skill_path))
+    renamed_files = []
+    for rel in results:
+        if rel:
             renamed_files.append(rel)
             log(f"  Renamed refs in: {rel}")
 
@@ -160,14 +342,16 @@ def rename_openclaw_refs(skill_path):
 
 # ── Commands ─────────────────────────────────────────────────────────────
 
-def scan_skill(skill_path, rename=False):
+def scan_skill(skill_path, rename=False, use_cache=False):
     """Scan a single skill. Returns scan result dict."""
     skill_path = Path(skill_path).resolve()
     skill_name = skill_path.name
 
     log(f"Scanning: {skill_name}")
 
-    clean, findings, raw = run_scanner(skill_path)
+    clean, findings, raw = run_scanner(skill_path, use_cache=use_cache)
+    if raw == "cached":
+        log(f"  Unchanged since last scan — cached verdict")
 
     result = {
         "skill": skill_name,
@@ -203,19 +387,27 @@ def scan_skill(skill_path, rename=False):
     return result
 
 
-def scan_all(rename=False):
+def scan_all(rename=False, use_cache=False):
     """Scan all installed skills."""
     if not SKILLS_DIR.exists():
         log(f"No skills directory at {SKILLS_DIR}", "ERROR")
         return []
 
-    results = []
-    for skill_dir in sorted(SKILLS_DIR.iterdir()):
-        if skill_dir.is_dir() and not skill_dir.name.startswith("."):
-            result = scan_skill(skill_dir, rename=rename)
-            results.append(result)
+    skill_dirs = [
+        d for d in sorted(SKILLS_DIR.iterdir())
+        if d.is_dir() and not d.name.startswith(".")
+    ]
 
-    return results
+    if len(skill_dirs) > 1:
+        # One scanner subprocess per skill is the bottleneck — spread the
+        # skills across cores; map() keeps results in directory order
+        workers = min(os.cpu_count() or 1, len(skill_dirs))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(
+                partial(scan_skill, rename=rename, use_cache=use_cache), skill_dirs
+            ))
+
+    return [scan_skill(d, rename=rename, use_cache=use_cache) for d in skill_dirs]
 
 
 def install_skill(skill_source, skip_scan=False):
@@ -231,16 +423,13 @@ def install_skill(skill_source, skip_scan=False):
 
     # Step 1: Quarantine
     log(f"Step 1/4: Quarantining → {quarantine_path}")
-    shutil.copytree(source, quarantine_path)
+    _clone_tree(source, quarantine_path)
 
     # Step 2: Scan
     if not skip_scan:
         log("Step 2/4: Scanning with skill-scanner")
         result = scan_skill(quarantine_path, rename=False)
-
-        registry = load_registry()
-        registry["scans"].append(result)
-        save_registry(registry)
+        append_registry(result)
 
         if not result["clean"]:
             log(f"BLOCKED: {skill_name} failed scan. Quarantined at: {quarantine_path}", "ERROR")
@@ -266,12 +455,13 @@ def install_skill(skill_source, skip_scan=False):
     else:
         log(f"Step 4/4: Installing → {install_path}")
 
-    shutil.copytree(quarantine_path, install_path)
+    # The quarantine copy is discarded after install anyway — rename it into
+    # place instead of copying the whole tree a second time
+    shutil.move(str(quarantine_path), str(install_path))
     log(f"INSTALLED: {skill_name}", "OK")
 
     # Update registry
-    registry = load_registry()
-    registry["scans"].append({
+    append_registry({
         "skill": skill_name,
         "path": str(install_path),
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -280,11 +470,6 @@ def install_skill(skill_source, skip_scan=False):
         "renamed_files": renamed,
         "installed": True,
     })
-    save_registry(registry)
-
-    # Cleanup quarantine
-    shutil.rmtree(quarantine_path, ignore_errors=True)
-    log("Quarantine cleaned")
 
     return True
 
@@ -292,12 +477,10 @@ def install_skill(skill_source, skip_scan=False):
 def cron_mode():
     """Re-scan all installed skills. Exit 1 if threats found."""
     log("═══ SkillGuard Cron Scan ═══")
-    results = scan_all(rename=False)
+    results = scan_all(rename=False, use_cache=True)
 
-    registry = load_registry()
     for r in results:
-        registry["scans"].append(r)
-    save_registry(registry)
+        append_registry(r)
 
     clean = sum(1 for r in results if r["clean"])
     total = len(results)
@@ -312,8 +495,13 @@ def cron_mode():
 
 def show_history():
     """Display scan history."""
-    registry = load_registry()
-    scans = registry.get("scans", [])
+    scans = _tail_entries(25)
+    if not scans and SCAN_REGISTRY.exists():
+        # Legacy single-file registry from before the JSONL log
+        try:
+            scans = json.loads(SCAN_REGISTRY.read_text()).get("scans", [])[-25:]
+        except json.JSONDecodeError:
+            scans = []
 
     if not scans:
         print("No scan history. Run: python3 skill-guard.py scan-all")
@@ -321,7 +509,7 @@ def show_history():
 
     print(f"\n{'Skill':<20} {'Date':<22} {'Status':<10} {'Renamed':<10} {'Findings'}")
     print("─" * 80)
-    for s in scans[-25:]:
+    for s in scans:
         status = "CLEAN" if s.get("clean") else "THREAT"
         renamed = "yes" if s.get("renamed") else "no"
         installed = " [installed]" if s.get("installed") else ""
@@ -333,7 +521,8 @@ def show_history():
 
 # ── Main ─────────────────────────────────────────────────────────────────
 
-def main():
+@lru_cache(maxsize=1)
+def _parser():
     parser = argparse.ArgumentParser(
         description="SkillGuard — SuperClaw Skill Security Pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -366,22 +555,23 @@ Requires: pip install cisco-ai-skill-scanner
 
     sub.add_parser("cron", help="Re-scan all installed skills (for cron jobs)")
     sub.add_parser("history", help="Show scan history")
+    return parser
 
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     ensure_dirs()
 
     if args.command == "scan":
         result = scan_skill(args.path, rename=args.rename)
-        registry = load_registry()
-        registry["scans"].append(result)
-        save_registry(registry)
+        append_registry(result)
         sys.exit(0 if result["clean"] else 1)
 
     elif args.command == "scan-all":
         results = scan_all(rename=args.rename)
-        registry = load_registry()
-        registry["scans"].extend(results)
-        save_registry(registry)
+        for r in results:
+            append_registry(r)
         threats = [r for r in results if not r["clean"]]
         sys.exit(1 if threats else 0)
 
@@ -10,9 +10,11 @@ Flow:
   2. `vault.py unlock`   — Decrypt vault → generate live config → start gateway
   3. `vault.py rotate`   — Change vault passphrase
   4. `vault.py set KEY`  — Update a single secret
-  5. `vault.py list`     — Show secret names (not values)
+  5. `vault.py set-many K=V ...` — Update several secrets in one unlock
+  6. `vault.py list`     — Show secret names (not values)
 
-The vault uses Fernet symmetric encryption (AES-128-CBC + HMAC-SHA256).
+The vault uses AES-256-GCM authenticated encryption (legacy Fernet
+vaults are still readable and upgrade on the next write).
 The passphrase is never stored — you enter it on unlock.
 
 Usage:
@@ -30,21 +32,51 @@ Usage:
 """
 
 import argparse
+import atexit
 import base64
+import ctypes
+import ctypes.util
 import getpass
 import hashlib
 import json
+import mmap
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 try:
-    from cryptography.fernet import Fernet
+    from cryptography.fernet import Fernet  # legacy vaults only
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 except ImportError:
     print("Missing dependency: pip install cryptography")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:  # optional — JSON falls back to stdlib
+    orjson = None
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps_indent(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _json_dumps_compact(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
 # ── Paths ────────────────────────────────────────────────────────────────
 
 SUPERCLAW_HOME = Path(os.environ.get("SUPERCLAW_HOME", Path.home() / ".superclaw"))
@@ -71,22 +103,137 @@ SECRET_KEYS = [
 
 # ── Crypto ───────────────────────────────────────────────────────────────
 
+# Bind OpenSSL's PKCS5_PBKDF2_HMAC directly — one C call with no per-call
+# wrapper dispatch. hashlib remains the fallback when libcrypto isn't
+# loadable (it produces identical output, just through a longer path).
+try:
+    _libcrypto = ctypes.CDLL(ctypes.util.find_library("crypto") or "libcrypto.so")
+    _libcrypto.PKCS5_PBKDF2_HMAC.argtypes = [
+        ctypes.c_void_p, ctypes.c_int,      # password (bytes or wipeable buffer)
+        ctypes.c_char_p, ctypes.c_int,      # salt
+        ctypes.c_int,                       # iterations
+        ctypes.c_void_p,                    # EVP_MD *digest
+        ctypes.c_int, ctypes.c_char_p,      # keylen, out
+    ]
+    _libcrypto.PKCS5_PBKDF2_HMAC.restype = ctypes.c_int
+    _libcrypto.EVP_sha256.restype = ctypes.c_void_p
+    _EVP_SHA256 = _libcrypto.EVP_sha256()
+except (OSError, AttributeError):
+    _libcrypto = None
+
+# OWASP-recommended floor for PBKDF2-SHA256; the per-process key cache
+# below keeps multi-step flows (set, rotate) to one derivation per passphrase
+PBKDF2_ITERATIONS = 600_000
+
+# Iteration count used by pre-GCM vaults — changing it changes the derived
+# key, so the legacy decrypt path must keep deriving with this value
+_LEGACY_PBKDF2_ITERATIONS = 100_000
+
+
+def _pbkdf2_sha256(password: bytes | bytearray, salt: bytes, iterations: int) -> bytes:
+    """32-byte PBKDF2-HMAC-SHA256, via libcrypto when available."""
+    if _libcrypto is not None:
+        out = ctypes.create_string_buffer(32)
+        if isinstance(password, bytearray):
+            pw = (ctypes.c_char * len(password)).from_buffer(password)
+        else:
+            pw = password
+        if _libcrypto.PKCS5_PBKDF2_HMAC(
+            pw, len(password), salt, len(salt),
+            iterations, _EVP_SHA256, 32, out,
+        ) == 1:
+            return out.raw
+    return hashlib.pbkdf2_hmac("sha256", password, salt, iterations)[:32]
+
+
+def _wipe(buf: bytearray) -> None:
+    """Best-effort zero of sensitive bytes before the buffer is freed."""
+    ctypes.memset((ctypes.c_char * len(buf)).from_buffer(buf), 0, len(buf))
+
+
+@lru_cache(maxsize=4)
 def derive_key(passphrase: str) -> bytes:
-    """Derive a Fernet key from a passphrase using PBKDF2."""
+    """Derive a 32-byte AES key from a passphrase using PBKDF2.
+
+    Cached per passphrase so flows that decrypt and re-encrypt (set,
+    rotate) pay for the 600k-iteration derivation once, not twice.
+    """
     # Use a fixed salt derived from the vault path (unique per install)
     salt = hashlib.sha256(str(VAULT_FILE).encode()).digest()[:16]
-    key = hashlib.pbkdf2_hmac("sha256", passphrase.encode(), salt, 100_000)
-    return base64.urlsafe_b64encode(key[:32])
+    # Hand the KDF a mutable copy of the passphrase and zero it afterwards
+    # so it doesn't linger on the heap (the str itself is immutable —
+    # wiping the working bytes is the best Python can do)
+    pw = bytearray(passphrase, "utf-8")
+    try:
+        return _pbkdf2_sha256(pw, salt, PBKDF2_ITERATIONS)
+    finally:
+        _wipe(pw)
+
+
+def _derive_legacy_key(passphrase: str) -> bytes:
+    """Derive the Fernet key exactly as pre-GCM vaults did.
+
+    Same salt, but 100k iterations and base64 encoding — the iteration
+    bump in PBKDF2_ITERATIONS changed derive_key's output, so legacy
+    vaults can only be opened with the original parameters.
+    """
+    salt = hashlib.sha256(str(VAULT_FILE).encode()).digest()[:16]
+    pw = bytearray(passphrase, "utf-8")
+    try:
+        return base64.urlsafe_b64encode(_pbkdf2_sha256(pw, salt, _LEGACY_PBKDF2_ITERATIONS))
+    finally:
+        _wipe(pw)
+
+
+# Don't let derived keys outlive the process any longer than they must
+atexit.register(derive_key.cache_clear)
+
+
+# AES-GCM layout on disk: 12-byte random nonce || ciphertext+tag
+_NONCE_SIZE = 12
+
+
+def _secure_write(path: Path, data: bytes) -> None:
+    """Write data atomically with 0o600 permissions from the first byte.
+
+    write_bytes-then-chmod leaves a window where the file is world-
+    readable, and a crash mid-write truncates it. Write a same-directory
+    temp file created with the final mode, fsync, then rename over the
+    target.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    # O_CLOEXEC: the fd must never leak into a subprocess spawned by a
+    # concurrent thread; O_NOFOLLOW: refuse to write through a symlink
+    # planted at the temp path
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC | os.O_NOFOLLOW
+    fd = os.open(tmp, flags, 0o600)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+_GCM_TAG_SIZE = 16
 
 
 def encrypt_vault(secrets: dict, passphrase: str) -> None:
     """Encrypt secrets dict and write to vault file."""
     key = derive_key(passphrase)
-    f = Fernet(key)
-    data = json.dumps(secrets, indent=2).encode()
-    encrypted = f.encrypt(data)
-    VAULT_FILE.write_bytes(encrypted)
-    os.chmod(VAULT_FILE, 0o600)
+    data = _json_dumps_indent(secrets)
+    nonce = os.urandom(_NONCE_SIZE)
+    # Encrypt straight into the on-disk blob (nonce || ciphertext || tag)
+    # with update_into — no separate ciphertext object to concatenate.
+    # update_into wants block_size-1 bytes of slack past the data length.
+    blob = bytearray(_NONCE_SIZE + len(data) + 15 + _GCM_TAG_SIZE)
+    blob[:_NONCE_SIZE] = nonce
+    mv = memoryview(blob)
+    enc = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+    written = _NONCE_SIZE + enc.update_into(data, mv[_NONCE_SIZE:])
+    enc.finalize()
+    blob[written:written + _GCM_TAG_SIZE] = enc.tag
+    _secure_write(VAULT_FILE, bytes(mv[:written + _GCM_TAG_SIZE]))
 
 
 def decrypt_vault(passphrase: str) -> dict:
@@ -95,94 +242,160 @@ def decrypt_vault(passphrase: str) -> dict:
         print(f"No vault found at {VAULT_FILE}. Run: vault.py init")
         sys.exit(1)
     key = derive_key(passphrase)
-    f = Fernet(key)
-    try:
-        decrypted = f.decrypt(VAULT_FILE.read_bytes())
-        return json.loads(decrypted)
-    except Exception:
-        print("Wrong passphrase or corrupted vault.")
-        sys.exit(1)
+    # Map the file instead of read_bytes(): the ciphertext is fed to the
+    # AEAD straight from the page cache with no intermediate copy
+    with open(VAULT_FILE, "rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty vault file
+            print("Wrong passphrase or corrupted vault.")
+            sys.exit(1)
+        try:
+            try:
+                decrypted = AESGCM(key).decrypt(mm[:_NONCE_SIZE], mm[_NONCE_SIZE:], None)
+                return _json_loads(decrypted)
+            except Exception:
+                pass
+            # Vaults written before the AES-GCM switch used Fernet with a
+            # key derived at the old iteration count — re-derive with the
+            # legacy parameters before blaming the passphrase
+            try:
+                decrypted = Fernet(_derive_legacy_key(passphrase)).decrypt(mm[:])
+            except Exception:
+                print("Wrong passphrase or corrupted vault.")
+                sys.exit(1)
+        finally:
+            mm.close()
+    # Legacy vault opened fine — rewrite it in the current format now,
+    # rather than leaving the weaker encryption in place until the next
+    # set/rotate happens to run
+    secrets = _json_loads(decrypted)
+    encrypt_vault(secrets, passphrase)
+    print("Vault upgraded to AES-256-GCM.")
+    return secrets
 
 
 # ── Secret Detection ─────────────────────────────────────────────────────
 
-def find_secrets_in_config(config: dict, path="") -> dict:
+def extract_and_template(config: dict, path=()) -> tuple[dict, dict | list]:
     """
-    Walk a config dict and find values that look like secrets.
-    Returns {placeholder_name: actual_value}.
+    Walk a config once, collecting secret values and building the
+    placeholder template in the same pass.
+    Returns ({placeholder_name: actual_value}, templated_config).
     """
+    # Explicit stack instead of recursion: each frame pairs a source
+    # container with its pre-created output container, and every secret
+    # hit writes straight into one outer dict. Paths are tuples of keys
+    # (ints for list indices) — no string formatting for nodes that turn
+    # out not to be secrets, and a "[" or "." in a key can't mangle the
+    # placeholder name.
+    if not isinstance(config, (dict, list)):
+        return {}, config
     secrets = {}
-    if isinstance(config, dict):
-        for k, v in config.items():
-            current_path = f"{path}.{k}" if path else k
-            if isinstance(v, str) and _is_secret_key(k, v):
-                placeholder = _make_placeholder(current_path)
+    result = {} if isinstance(config, dict) else [None] * len(config)
+    stack = deque([(config, result, path)])
+    while stack:
+        src, dst, node_path = stack.pop()
+        is_dict = isinstance(src, dict)
+        for k, v in src.items() if is_dict else enumerate(src):
+            if isinstance(v, str) and is_dict and _is_secret_key(k, v):
+                placeholder = _make_placeholder(node_path + (k,))
                 secrets[placeholder] = v
+                dst[k] = f"${{{placeholder}}}"
             elif isinstance(v, (dict, list)):
-                secrets.update(find_secrets_in_config(v, current_path))
-    elif isinstance(config, list):
-        for i, item in enumerate(config):
-            secrets.update(find_secrets_in_config(item, f"{path}[{i}]"))
-    return secrets
+                if is_dict and k.lower() in _NON_SECRET_SUBTREES:
+                    dst[k] = v
+                    continue
+                child = {} if isinstance(v, dict) else [None] * len(v)
+                dst[k] = child
+                stack.append((v, child, node_path + (k,)))
+            else:
+                dst[k] = v
+    return secrets, result
+
+
+# One scan over the key name instead of six substring probes
+_SECRET_KEY_RE = re.compile(r"key|token|secret|password|credential|auth", re.IGNORECASE)
+
+# Config sections that never hold credentials — copied to the template
+# verbatim without scanning every leaf
+_NON_SECRET_SUBTREES = {"logging", "ui", "paths", "display", "telemetry"}
 
 
 def _is_secret_key(key: str, value: str) -> bool:
     """Check if a key/value pair looks like a secret."""
-    key_lower = key.lower()
-    # Check key name patterns
-    for pattern in ["key", "token", "secret", "password", "credential", "auth"]:
-        if pattern in key_lower:
-            # Exclude placeholder values and short values
-            if value and len(value) > 8 and not value.startswith("${") and not value.startswith("GENERATE"):
-                return True
-    return False
+    # Exclude placeholder values and short values
+    return (
+        bool(_SECRET_KEY_RE.search(key))
+        and bool(value)
+        and len(value) > 8
+        and not value.startswith(("${", "GENERATE"))
+    )
 
 
-def _make_placeholder(path: str) -> str:
-    """Convert a JSON path to a placeholder name."""
-    # env.OPENROUTER_API_KEY → OPENROUTER_API_KEY
-    # gateway.auth.token → GATEWAY_AUTH_TOKEN
-    parts = path.replace("[", ".").replace("]", "").split(".")
-    # Use the last meaningful parts
-    clean = "_".join(p.upper() for p in parts if p and not p.isdigit())
-    return clean
-
-
-def replace_secrets_with_placeholders(config: dict, secrets: dict, path="") -> dict:
-    """Replace secret values in config with ${PLACEHOLDER} markers."""
-    if isinstance(config, dict):
-        result = {}
-        for k, v in config.items():
-            current_path = f"{path}.{k}" if path else k
-            if isinstance(v, str):
-                placeholder = _make_placeholder(current_path)
-                if placeholder in secrets and secrets[placeholder] == v:
-                    result[k] = f"${{{placeholder}}}"
-                else:
-                    result[k] = v
-            elif isinstance(v, (dict, list)):
-                result[k] = replace_secrets_with_placeholders(v, secrets, current_path)
-            else:
-                result[k] = v
-        return result
-    elif isinstance(config, list):
-        return [
-            replace_secrets_with_placeholders(item, secrets, f"{path}[{i}]")
-            for i, item in enumerate(config)
-        ]
-    return config
+def _make_placeholder(path: tuple) -> str:
+    """Convert a config path tuple to a placeholder name."""
+    # ("env", "OPENROUTER_API_KEY") → ENV_OPENROUTER_API_KEY
+    # ("gateway", "auth", "token") → GATEWAY_AUTH_TOKEN
+    # List indices are ints and are dropped. Non-word characters become
+    # "_" — a "}" in a key would end the ${...} marker early, and dotted
+    # or hyphenated keys shouldn't leak their punctuation into the name
+    return "_".join(re.sub(r"\W", "_", p).upper() for p in path if isinstance(p, str))
+
+
+# Placeholder syntax written by extract_and_template. Match anything up to
+# the closing brace — restricting to word characters silently skipped
+# placeholders built from keys like "api-key", leaving the literal ${...}
+# marker in the unlocked config
+_PLACEHOLDER_RE = re.compile(r"\$\{([^}]+)\}")
 
 
 def inject_secrets(template: dict, secrets: dict) -> dict:
-    """Replace ${PLACEHOLDER} markers in template with actual secret values."""
-    text = json.dumps(template)
-    for placeholder, value in secrets.items():
-        text = text.replace(f"${{{placeholder}}}", value)
-    return json.loads(text)
+    """Replace ${PLACEHOLDER} markers in template with actual secret values.
+
+    Substitutes on string leaves only — no dumps/loads round trip, and a
+    secret value can never corrupt the config by containing a quote or
+    backslash. Mutates the template in place (and returns it), so the
+    injected config never exists as a second full copy in memory.
+    """
+    def _sub(m):
+        return secrets.get(m.group(1), m.group(0))
+
+    if not isinstance(template, (dict, list)):
+        return template
+    stack = deque([template])
+    while stack:
+        node = stack.pop()
+        is_dict = isinstance(node, dict)
+        for k, v in node.items() if is_dict else enumerate(node):
+            if isinstance(v, str) and "${" in v:
+                node[k] = _PLACEHOLDER_RE.sub(_sub, v)
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
+    return template
+
+
+def _has_placeholder(node, target: str) -> bool:
+    """True if ${target} appears in any string leaf of a parsed config."""
+    marker = f"${{{target}}}"
+    stack = deque([node])
+    while stack:
+        n = stack.pop()
+        if isinstance(n, dict):
+            stack.extend(n.values())
+        elif isinstance(n, list):
+            stack.extend(n)
+        elif isinstance(n, str) and marker in n:
+            return True
+    return False
 
 
 # ── Commands ─────────────────────────────────────────────────────────────
 
+def _mask(value: str) -> str:
+    """Mask a secret value for display."""
+    return f"{value[:4]}...{value[-4:]}" if len(value) > 12 else "****"
+
 def cmd_init():
     """Extract secrets from existing config into encrypted vault."""
     if not LIVE_CONFIG.exists():
@@ -190,17 +403,26 @@ def cmd_init():
         print("Create your config first, then run vault.py init to secure it.")
         sys.exit(1)
 
-    config = json.loads(LIVE_CONFIG.read_text())
-    secrets = find_secrets_in_config(config)
+    config = _json_loads(LIVE_CONFIG.read_bytes())
+    secrets, template = extract_and_template(config)
 
     if not secrets:
         print("No secrets detected in config. Nothing to vault.")
         return
 
+    # Self-check before anything is written: injecting the secrets back
+    # into the template must reproduce the config exactly, otherwise
+    # unlock would silently emit a broken config (an unmatchable
+    # placeholder, or two keys sanitized to the same name)
+    roundtrip = inject_secrets(_json_loads(_json_dumps_compact(template)), secrets)
+    if roundtrip != config:
+        print("Internal error: template does not round-trip to the original config.")
+        print("No files were written — please report this.")
+        sys.exit(1)
+
     print(f"Found {len(secrets)} secret(s):")
-    for name in sorted(secrets):
-        masked = secrets[name][:4] + "..." + secrets[name][-4:] if len(secrets[name]) > 12 else "****"
-        print(f"  {name}: {masked}")
+    for name, val in sorted(secrets.items()):
+        print(f"  {name}: {_mask(val)}")
 
     # Get passphrase
     print()
@@ -213,16 +435,24 @@ def cmd_init():
         print("Passphrase must be at least 8 characters.")
         sys.exit(1)
 
+    # Overlap the slow key derivation with the template write — the result
+    # lands in derive_key's cache, so encrypt_vault below finds it ready
+    # (PBKDF2 runs in C and releases the GIL)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        key_future = pool.submit(derive_key, passphrase)
+
+        # Write template (config with placeholders instead of secrets).
+        # Compact form: the template is machine-read on every unlock —
+        # use `vault.py show-template` to inspect it
+        _secure_write(TEMPLATE_FILE, _json_dumps_compact(template))
+        print(f"Template created: {TEMPLATE_FILE}")
+
+        key_future.result()
+
     # Create vault
     encrypt_vault(secrets, passphrase)
     print(f"Vault created: {VAULT_FILE}")
 
-    # Create template (config with placeholders instead of secrets)
-    template = replace_secrets_with_placeholders(config, secrets)
-    TEMPLATE_FILE.write_text(json.dumps(template, indent=2))
-    os.chmod(TEMPLATE_FILE, 0o600)
-    print(f"Template created: {TEMPLATE_FILE}")
-
     print()
     print("Your secrets are now encrypted. On startup, run:")
     print("  python3 vault.py unlock")
@@ -239,11 +469,10 @@ def cmd_unlock():
     passphrase = getpass.getpass("Vault passphrase: ")
     secrets = decrypt_vault(passphrase)
 
-    template = json.loads(TEMPLATE_FILE.read_text())
+    template = _json_loads(TEMPLATE_FILE.read_bytes())
     config = inject_secrets(template, secrets)
 
-    LIVE_CONFIG.write_text(json.dumps(config, indent=2))
-    os.chmod(LIVE_CONFIG, 0o600)
+    _secure_write(LIVE_CONFIG, _json_dumps_indent(config))
     print(f"Config generated: {LIVE_CONFIG}")
     print(f"Secrets injected: {len(secrets)}")
 
@@ -270,12 +499,34 @@ def cmd_set(key_name):
 
     # Also update template if needed
     if TEMPLATE_FILE.exists():
-        template = json.loads(TEMPLATE_FILE.read_text())
-        template_text = json.dumps(template)
-        if f"${{{key_name}}}" not in template_text:
+        # Structural check: a raw-bytes grep would also match the marker
+        # inside an unrelated key or comment-like value
+        template = _json_loads(TEMPLATE_FILE.read_bytes())
+        if not _has_placeholder(template, key_name):
             print(f"Note: ${{{key_name}}} not found in template. You may need to add it manually.")
 
 
+def cmd_set_many(pairs):
+    """Update several secrets with one unlock and one re-encrypt."""
+    updates = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key or not value:
+            print(f"Invalid pair '{pair}' — expected KEY=value.")
+            sys.exit(1)
+        updates[key] = value
+
+    passphrase = getpass.getpass("Vault passphrase: ")
+    secrets = decrypt_vault(passphrase)
+    created = [k for k in updates if k not in secrets]
+    secrets.update(updates)
+    encrypt_vault(secrets, passphrase)
+
+    print(f"Updated {len(updates)} secret(s).")
+    if created:
+        print(f"Created: {', '.join(sorted(created))}")
+
+
 def cmd_rotate():
     """Change vault passphrase."""
     old_pass = getpass.getpass("Current passphrase: ")
@@ -291,16 +542,23 @@ def cmd_rotate():
     print("Passphrase rotated successfully.")
 
 
+def cmd_show_template():
+    """Pretty-print the config template (stored compact on disk)."""
+    if not TEMPLATE_FILE.exists():
+        print(f"No template found at {TEMPLATE_FILE}. Run: vault.py init")
+        sys.exit(1)
+    template = _json_loads(TEMPLATE_FILE.read_bytes())
+    print(_json_dumps_indent(template).decode())
+
+
 def cmd_list():
     """Show secret names (not values)."""
     passphrase = getpass.getpass("Vault passphrase: ")
     secrets = decrypt_vault(passphrase)
 
     print(f"\nVault contains {len(secrets)} secret(s):")
-    for name in sorted(secrets):
-        val = secrets[name]
-        masked = val[:4] + "..." + val[-4:] if len(val) > 12 else "****"
-        print(f"  {name}: {masked}")
+    for name, val in sorted(secrets.items()):
+        print(f"  {name}: {_mask(val)}")
 
 
 # ── Main ─────────────────────────────────────────────────────────────────
@@ -317,7 +575,7 @@ Flow:
   4. vault.py rotate    Change vault passphrase
   5. vault.py list      Show secret names (masked)
 
-Secrets are encrypted with AES-128-CBC + HMAC-SHA256 (Fernet).
+Secrets are encrypted with AES-256-GCM.
 The passphrase is never stored — enter it on each unlock.
         """,
     )
@@ -329,8 +587,12 @@ The passphrase is never stored — enter it on each unlock.
     p_set = sub.add_parser("set", help="Update a single secret")
     p_set.add_argument("key", help="Secret name to update")
 
+    p_set_many = sub.add_parser("set-many", help="Update several secrets in one unlock")
+    p_set_many.add_argument("pairs", nargs="+", metavar="KEY=VALUE", help="Secrets to set")
+
     sub.add_parser("rotate", help="Change vault passphrase")
     sub.add_parser("list", help="Show secret names (masked)")
+    sub.add_parser("show-template", help="Pretty-print the config template")
 
     args = parser.parse_args()
 
@@ -340,10 +602,14 @@ The passphrase is never stored — enter it on each unlock.
         cmd_unlock()
     elif args.command == "set":
         cmd_set(args.key)
+    elif args.command == "set-many":
+        cmd_set_many(args.pairs)
     elif args.command == "rotate":
         cmd_rotate()
     elif args.command == "list":
         cmd_list()
+    elif args.command == "show-template":
+        cmd_show_template()
     else:
         parser.print_help()
 